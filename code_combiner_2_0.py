@@ -1,71 +1,161 @@
 import os
+import io
+import re
+import math
+import mmap
 import sys
-import threading
+import queue
+import atexit
 import mimetypes
+import codecs
+import fnmatch
 import time
 import logging
-import traceback
+import logging.handlers
 import subprocess
 import venv
+import hashlib
+import platform
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from functools import wraps
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-import multiprocessing
+from functools import wraps, lru_cache, partial
+from itertools import islice
+from collections import deque, Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # ============================================================================
 # PYTHON VERSION AND VIRTUAL ENVIRONMENT SETUP
 # ============================================================================
 REQUIRED_PYTHON_VERSION = (3, 10, 11)
 VENV_DIR = Path(__file__).parent / ".venv_codecombiner"
+# Set in the environment of the child process started inside the venv
+RELAUNCH_ENV_VAR = "CODECOMBINER_RELAUNCHED"
+# Written once the venv has all dependencies; lets warm starts skip the checks
+VENV_MARKER = VENV_DIR / ".validated"
+
+# Packages needed by the application (import name -> pip package name)
+REQUIRED_PACKAGES = {
+    'PyQt6': 'PyQt6'
+}
+
+def in_virtual_environment():
+    """Check if the current interpreter is running inside a virtual environment."""
+    return hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+
+def get_venv_python():
+    """Get the path of the python executable inside VENV_DIR."""
+    if sys.platform == "win32":
+        return VENV_DIR / "Scripts" / "python.exe"
+    return VENV_DIR / "bin" / "python"
+
+def _venv_marker_contents():
+    """Marker text identifying the interpreter version and required package set."""
+    packages = ",".join(f"{k}={v}" for k, v in sorted(REQUIRED_PACKAGES.items()))
+    return f"{platform.python_version()}\n{hashlib.sha256(packages.encode()).hexdigest()}\n"
+
+def is_venv_validated():
+    """Check if the venv marker matches the current interpreter and package list."""
+    try:
+        return VENV_MARKER.read_text() == _venv_marker_contents()
+    except OSError:
+        return False
+
+def running_in_app_venv():
+    """Check if the current interpreter is the one from VENV_DIR."""
+    try:
+        return Path(sys.prefix).resolve() == VENV_DIR.resolve()
+    except OSError:
+        return False
+
+def mark_venv_validated():
+    """Record that the venv has every required package, if running inside it."""
+    if not running_in_app_venv():
+        return
+    try:
+        VENV_MARKER.write_text(_venv_marker_contents())
+    except OSError as e:
+        logger.warning(f"Could not write venv marker: {e}")
+
+# Startup messages are collected and written in batches rather than one print() per line
+_startup_lines = []
+
+def startup_print(line=""):
+    """Queue a startup message; written by the next flush_startup_output()."""
+    _startup_lines.append(line)
+
+def flush_startup_output():
+    """Write all queued startup messages with a single write call."""
+    if _startup_lines:
+        sys.stdout.write("\n".join(_startup_lines) + "\n")
+        _startup_lines.clear()
+    sys.stdout.flush()
 
 def check_python_version():
     """Check if running Python 3.10.11 or compatible."""
     current_version = sys.version_info[:3]
     if current_version < REQUIRED_PYTHON_VERSION:
-        print(f"⚠ Warning: Python {'.'.join(map(str, REQUIRED_PYTHON_VERSION))} recommended, running {'.'.join(map(str, current_version))}")
-        print("Consider upgrading Python for optimal performance.")
+        startup_print(f"⚠ Warning: Python {'.'.join(map(str, REQUIRED_PYTHON_VERSION))} recommended, running {'.'.join(map(str, current_version))}")
+        startup_print("Consider upgrading Python for optimal performance.")
     else:
-        print(f"✓ Python version {'.'.join(map(str, current_version))} is compatible")
+        startup_print(f"✓ Python version {'.'.join(map(str, current_version))} is compatible")
 
 def setup_virtual_environment():
     """Create and activate virtual environment if not already running in one."""
     # Check if already in a virtual environment
-    in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+    in_venv = in_virtual_environment()
 
     if in_venv:
-        print(f"✓ Running in virtual environment: {sys.prefix}")
+        startup_print(f"✓ Running in virtual environment: {sys.prefix}")
         return True
 
-    # Check if venv directory exists
-    if not VENV_DIR.exists():
-        print(f"Creating virtual environment at {VENV_DIR}...")
+    # Never relaunch twice, even if the venv interpreter is not detected as one
+    if os.environ.get(RELAUNCH_ENV_VAR):
+        return False
+
+    # Check if venv directory exists (a valid marker implies it does)
+    if is_venv_validated():
+        startup_print(f"✓ Virtual environment validated at {VENV_DIR}")
+    elif not VENV_DIR.exists():
+        startup_print(f"Creating virtual environment at {VENV_DIR}...")
+        flush_startup_output()
         try:
             venv.create(VENV_DIR, with_pip=True)
-            print("✓ Virtual environment created successfully")
+            startup_print("✓ Virtual environment created successfully")
         except Exception as e:
-            print(f"⚠ Warning: Could not create virtual environment: {e}")
-            print("Continuing without virtual environment...")
+            startup_print(f"⚠ Warning: Could not create virtual environment: {e}")
+            startup_print("Continuing without virtual environment...")
             return False
     else:
-        print(f"✓ Virtual environment found at {VENV_DIR}")
+        startup_print(f"✓ Virtual environment found at {VENV_DIR}")
 
     # Determine the python executable in the venv
-    if sys.platform == "win32":
-        venv_python = VENV_DIR / "Scripts" / "python.exe"
-    else:
-        venv_python = VENV_DIR / "bin" / "python"
+    venv_python = get_venv_python()
 
     # If not in venv, restart script with venv python
     if not in_venv and venv_python.exists():
-        print(f"Restarting in virtual environment...")
+        startup_print("Restarting in virtual environment...")
         try:
             # Re-run this script with the venv Python
-            result = subprocess.run([str(venv_python), __file__] + sys.argv[1:])
-            sys.exit(result.returncode)
+            os.environ[RELAUNCH_ENV_VAR] = "1"
+            args = [str(venv_python), __file__, *sys.argv[1:]]
+            if sys.platform == "win32":
+                flush_startup_output()
+                # execv on Windows spawns a new process and returns control to the
+                # console immediately, so wait for the child instead
+                result = subprocess.run(args)
+                sys.exit(result.returncode)
+
+            # Replace the current process image; exec skips interpreter shutdown,
+            # so flush anything printed so far first
+            flush_startup_output()
+            stop_file_logging()
+            sys.stderr.flush()
+            os.execv(str(venv_python), args)
         except Exception as e:
-            print(f"⚠ Warning: Could not restart in venv: {e}")
-            print("Continuing with current Python...")
+            startup_print(f"⚠ Warning: Could not restart in venv: {e}")
+            startup_print("Continuing with current Python...")
+            enable_file_logging()
             return False
 
     return True
@@ -77,6 +167,9 @@ def setup_virtual_environment():
 LOG_DIR = Path(__file__).parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# Shared by all log files of this run so correlated entries are easy to match up
+_LOG_STAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+
 # Create formatters
 detailed_formatter = logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
@@ -84,15 +177,61 @@ detailed_formatter = logging.Formatter(
 )
 simple_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
+
+# Size cap per log file; older logs are kept as .1 ... .5 backups
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that writes through a 64 KiB buffer instead of flushing every record.
+
+    Buffered data is pushed to disk on ERROR records and when the handler is closed.
+    """
+
+    def __init__(self, filename, buffer_size=65536, **kwargs):
+        self.buffer_size = buffer_size
+        super().__init__(filename, **kwargs)
+
+    def _open(self):
+        raw = open(self.baseFilename, 'ab')
+        return io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=self.buffer_size),
+            encoding=self.encoding or 'utf-8',
+            errors=self.errors
+        )
+
+    def flush(self):
+        # StreamHandler.emit() calls flush() after every record; skip it so the
+        # buffer actually batches writes. close() still flushes the stream.
+        pass
+
+    def shouldRollover(self, record):
+        # The base class seeks/tells on the text stream, which flushes it on every
+        # record. The binary buffer position is close enough for a size cap.
+        if self.stream is None:
+            self.stream = self._open()
+        return self.maxBytes > 0 and self.stream.buffer.tell() >= self.maxBytes
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR and self.stream is not None:
+            self.acquire()
+            try:
+                self.stream.flush()
+            finally:
+                self.release()
+
+
 # Main logger
 logger = logging.getLogger('CodeCombiner')
 logger.setLevel(logging.DEBUG)
 
 # File handler for detailed logs
-file_handler = logging.FileHandler(LOG_DIR / f'codecombiner_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+file_handler = BufferedRotatingFileHandler(LOG_DIR / f'codecombiner_{_LOG_STAMP}.log', maxBytes=LOG_MAX_BYTES,
+                                           backupCount=LOG_BACKUP_COUNT, delay=True)
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(detailed_formatter)
-logger.addHandler(file_handler)
 
 # Console handler for important messages
 console_handler = logging.StreamHandler()
@@ -100,55 +239,178 @@ console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(simple_formatter)
 logger.addHandler(console_handler)
 
-# Performance logger
+# Performance logger (propagates to the main logger's queue)
 perf_logger = logging.getLogger('CodeCombiner.Performance')
 perf_logger.setLevel(logging.DEBUG)
-perf_handler = logging.FileHandler(LOG_DIR / f'performance_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+perf_handler = BufferedRotatingFileHandler(LOG_DIR / f'performance_{_LOG_STAMP}.log', maxBytes=LOG_MAX_BYTES,
+                                           backupCount=LOG_BACKUP_COUNT, delay=True)
 perf_handler.setFormatter(detailed_formatter)
-perf_logger.addHandler(perf_handler)
+perf_handler.addFilter(logging.Filter(perf_logger.name))
+
+# File writes happen on a background listener thread so logging calls never
+# block on disk I/O in the caller
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, file_handler, perf_handler, respect_handler_level=True)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_file_logging_enabled = False
+
+def enable_file_logging():
+    """Attach the log files to the main logger (safe to call more than once)."""
+    global _file_logging_enabled
+    if _file_logging_enabled:
+        return
+    _file_logging_enabled = True
+    logger.addHandler(_queue_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def stop_file_logging():
+    """Drain the log queue and close the log files (needed before os.execv, which skips atexit)."""
+    global _file_logging_enabled
+    if not _file_logging_enabled:
+        return
+    _file_logging_enabled = False
+    logger.removeHandler(_queue_handler)
+    atexit.unregister(_log_listener.stop)
+    _log_listener.stop()
+    # The buffered handlers only write their data out on close()
+    file_handler.close()
+    perf_handler.close()
+
+# A launcher process that is about to re-run the script inside the venv leaves the
+# log files to the child; otherwise every launch would create two sets of logs
+if not (__name__ == "__main__" and not in_virtual_environment() and get_venv_python().exists()
+        and not os.environ.get(RELAUNCH_ENV_VAR)):
+    enable_file_logging()
+
+# Decorated calls slower than this (seconds) are logged as SLOW
+SLOW_THRESHOLD = 0.1
+# CODECOMBINER_TRACE=1 additionally logs an EXIT record for every decorated call
+TRACE_PERFORMANCE = os.environ.get("CODECOMBINER_TRACE") == "1"
 
 def log_performance(func):
     """Decorator to log function execution time and errors."""
+    # Get the function name for logging (constant per decorated function)
+    func_name = f"{func.__module__}.{func.__qualname__}"
+    is_enabled_for = perf_logger.isEnabledFor
+    warning_level = logging.WARNING
+    _pc = time.perf_counter
+    _dbg = perf_logger.debug
+    _warn = perf_logger.warning
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Get the function name for logging
-        func_name = f"{func.__module__}.{func.__qualname__}"
-        start_time = time.perf_counter()
-        perf_logger.debug(f"ENTER: {func_name}")
+        # Skip timing entirely when no performance record could be emitted
+        if not is_enabled_for(warning_level):
+            return func(*args, **kwargs)
 
+        start_time = _pc()
         try:
             result = func(*args, **kwargs)
-            elapsed = time.perf_counter() - start_time
-            perf_logger.debug(f"EXIT: {func_name} - Elapsed: {elapsed:.4f}s")
-
-            # Log slow operations (>100ms)
-            if elapsed > 0.1:
-                perf_logger.warning(f"SLOW: {func_name} took {elapsed:.4f}s")
-
-            return result
         except Exception as e:
-            elapsed = time.perf_counter() - start_time
-            perf_logger.error(f"ERROR in {func_name} after {elapsed:.4f}s: {str(e)}")
-            perf_logger.error(traceback.format_exc())
+            elapsed = _pc() - start_time
+            perf_logger.error("ERROR in %s after %.4fs: %s", func_name, elapsed, e, exc_info=True)
             raise
 
+        # At most one record per call: slow operations always, the rest only when tracing
+        elapsed = _pc() - start_time
+        if elapsed > SLOW_THRESHOLD:
+            _warn("SLOW: %s took %.4fs", func_name, elapsed)
+        elif TRACE_PERFORMANCE:
+            _dbg("EXIT: %s - Elapsed: %.4fs", func_name, elapsed)
+
+        return result
+
     return wrapper
 
-# Detect available processing capabilities
-CPU_COUNT = multiprocessing.cpu_count()
-logger.info(f"System has {CPU_COUNT} CPU cores available")
+def _set_cpu_affinity():
+    """Pin the process to the physical cores of a single CPU socket.
+
+    Only applies on Linux hosts where the allowed CPUs span more than one
+    socket; worker threads inherit the affinity of the process.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+
+    try:
+        allowed = os.sched_getaffinity(0)
+        topology = {}
+        for cpu in allowed:
+            base = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology")
+            package_id = int((base / "physical_package_id").read_text())
+            core_id = int((base / "core_id").read_text())
+            topology[cpu] = (package_id, core_id)
+    except (OSError, ValueError):
+        return
+
+    packages = {package_id for package_id, _ in topology.values()}
+    if len(packages) < 2:
+        return
+
+    # Keep one logical CPU (the lowest numbered SMT sibling) per physical core of the first socket
+    first_package = min(packages)
+    cores = {}
+    for cpu in sorted(topology):
+        package_id, core_id = topology[cpu]
+        if package_id == first_package:
+            cores.setdefault(core_id, cpu)
+
+    try:
+        os.sched_setaffinity(0, set(cores.values()))
+        logger.info(f"Pinned process to {len(cores)} cores on CPU socket {first_package}")
+    except OSError as e:
+        logger.warning(f"Could not set CPU affinity: {e}")
+
+
+def _read_cgroup_cpu_limit():
+    """Get the CPU limit imposed by a cgroup quota (v2, then v1), or None if unlimited."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota == "max":
+            return None
+        quota, period = int(quota), int(period)
+    except (OSError, ValueError):
+        try:
+            quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+            period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        except (OSError, ValueError):
+            return None
+        if quota <= 0:
+            return None
+
+    if period <= 0:
+        return None
+    return max(1, -(-quota // period))
+
+
+def _detect_cpu_count():
+    """Count the CPUs this process can actually use.
+
+    Honors CPU affinity (taskset, pinning) and cgroup quotas (containers).
+    The CODECOMBINER_MAX_WORKERS environment variable overrides the result.
+    """
+    override = os.environ.get("CODECOMBINER_MAX_WORKERS")
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            logger.warning(f"Ignoring invalid CODECOMBINER_MAX_WORKERS value: {override}")
 
-# Check for GPU (basic detection - PyQt doesn't typically use GPU)
-try:
-    import torch
-    GPU_AVAILABLE = torch.cuda.is_available()
-    if GPU_AVAILABLE:
-        logger.info(f"GPU detected: {torch.cuda.get_device_name(0)}")
+    if hasattr(os, 'sched_getaffinity'):
+        count = len(os.sched_getaffinity(0))
     else:
-        logger.info("No GPU detected or CUDA not available")
-except ImportError:
-    GPU_AVAILABLE = False
-    logger.info("PyTorch not installed - GPU acceleration not available")
+        count = os.cpu_count() or 1
+
+    cgroup_limit = _read_cgroup_cpu_limit()
+    if cgroup_limit is not None:
+        count = min(count, cgroup_limit)
+    return count
+
+
+# Detect available processing capabilities
+_set_cpu_affinity()
+CPU_COUNT = _detect_cpu_count()
+logger.info(f"System has {CPU_COUNT} CPU cores available")
 
 # ============================================================================
 # AUTOMATIC DEPENDENCY INSTALLATION
@@ -156,66 +418,89 @@ except ImportError:
 # This section automatically checks for and installs required dependencies
 # making this script completely standalone and portable.
 
+# Output of pip runs; written straight to disk so a chatty install never
+# blocks on a full pipe, and failures stay diagnosable
+PIP_LOG_FILE = LOG_DIR / "pip_install.log"
+
+def run_logged(command):
+    """Run a command, appending its stdout and stderr to PIP_LOG_FILE."""
+    with open(PIP_LOG_FILE, 'ab') as log_file:
+        subprocess.check_call(command, stdout=log_file, stderr=subprocess.STDOUT)
+
 @log_performance
 def check_and_install_dependencies():
     """
     Check for required dependencies and install them if missing.
     This makes the script fully standalone.
     """
-    logger.info("Checking dependencies...")
-    required_packages = {
-        'PyQt6': 'PyQt6'
-    }
+    if running_in_app_venv() and is_venv_validated():
+        startup_print("✓ All dependencies are satisfied (validated)\n")
+        logger.info("Dependencies previously validated, skipping check")
+        return
 
+    logger.info("Checking dependencies...")
     missing_packages = []
 
-    # Check which packages are missing
-    for import_name, package_name in required_packages.items():
-        try:
-            __import__(import_name)
-            print(f"✓ {package_name} is already installed")
+    # Check which packages are missing (find_spec locates the package without importing it)
+    for import_name, package_name in REQUIRED_PACKAGES.items():
+        if importlib.util.find_spec(import_name) is not None:
+            startup_print(f"✓ {package_name} is already installed")
             logger.info(f"{package_name} is installed")
-        except ImportError:
-            print(f"✗ {package_name} is not installed")
+        else:
+            startup_print(f"✗ {package_name} is not installed")
             logger.warning(f"{package_name} is missing")
             missing_packages.append(package_name)
 
     # Install missing packages
     if missing_packages:
-        print(f"\nInstalling missing dependencies: {', '.join(missing_packages)}")
-        print("This may take a few moments...\n")
+        startup_print(f"\nInstalling missing dependencies: {', '.join(missing_packages)}")
+        startup_print("This may take a few moments...\n")
+        flush_startup_output()
         logger.info(f"Installing packages: {missing_packages}")
 
-        for package in missing_packages:
-            try:
-                print(f"Installing {package}...")
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", package],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                print(f"✓ {package} installed successfully")
+        pip_install = [sys.executable, "-m", "pip", "install",
+                       "--disable-pip-version-check", "--no-input"]
+
+        try:
+            # Install everything with a single pip invocation
+            run_logged(pip_install + missing_packages)
+            for package in missing_packages:
+                startup_print(f"✓ {package} installed successfully")
                 logger.info(f"{package} installed successfully")
-            except subprocess.CalledProcessError as e:
-                error_msg = f"Failed to install {package}: {e}"
-                print(f"✗ {error_msg}")
-                logger.error(error_msg)
-                print("\nPlease install manually using:")
-                print(f"  pip install {package}")
-                sys.exit(1)
-
-        print("\n✓ All dependencies installed successfully!")
-        print("Continuing with application startup...\n")
+        except subprocess.CalledProcessError as e:
+            # Batch install failed - retry one package at a time to find the culprit
+            logger.warning(f"Batch install failed ({e}), retrying packages individually")
+            for package in missing_packages:
+                try:
+                    startup_print(f"Installing {package}...")
+                    flush_startup_output()
+                    run_logged(pip_install + [package])
+                    startup_print(f"✓ {package} installed successfully")
+                    logger.info(f"{package} installed successfully")
+                except subprocess.CalledProcessError as e:
+                    error_msg = f"Failed to install {package}: {e}"
+                    startup_print(f"✗ {error_msg}")
+                    logger.error(error_msg)
+                    startup_print(f"See {PIP_LOG_FILE} for details.")
+                    startup_print("\nPlease install manually using:")
+                    startup_print(f"  pip install {package}")
+                    flush_startup_output()
+                    sys.exit(1)
+
+        startup_print("\n✓ All dependencies installed successfully!")
+        startup_print("Continuing with application startup...\n")
         logger.info("All dependencies installed")
     else:
-        print("✓ All dependencies are satisfied\n")
+        startup_print("✓ All dependencies are satisfied\n")
         logger.info("All dependencies satisfied")
 
+    mark_venv_validated()
+
 # Run startup checks before importing PyQt6
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Code Combiner - Startup")
-    print("=" * 70)
+    startup_print("=" * 70)
+    startup_print("Code Combiner - Startup")
+    startup_print("=" * 70)
 
     # Check Python version
     check_python_version()
@@ -225,8 +510,9 @@ if __name__ == "__main__":
 
     # Check and install dependencies
     check_and_install_dependencies()
-    print("=" * 70)
-    print()
+    startup_print("=" * 70)
+    startup_print()
+    flush_startup_output()
 
 # ============================================================================
 # MAIN APPLICATION IMPORTS
@@ -234,27 +520,23 @@ if __name__ == "__main__":
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFileDialog, QTreeView, QTextEdit,
+    QPushButton, QLabel, QFileDialog, QTextEdit, QPlainTextEdit,
     QCheckBox, QProgressBar, QSplitter, QFrame, QTabWidget,
     QLineEdit, QGroupBox, QFormLayout, QMessageBox, QStyle,
-    QStyledItemDelegate, QHeaderView, QSpinBox, QComboBox,
+    QSpinBox, QComboBox,
     QTreeWidget, QTreeWidgetItem, QDialog, QDialogButtonBox,
-    QGraphicsOpacityEffect, QSizePolicy, QToolButton, QToolTip,
     QStatusBar, QScrollArea, QStyleFactory, QMenu
 )
 from PyQt6.QtCore import (
-    Qt, QDir, QDirIterator, QThread, pyqtSignal, QSize,
-    QStandardPaths, QModelIndex, QSettings, QObject, QTimer,
-    QPropertyAnimation, QEasingCurve, QEvent, QRect, QPoint,
-    QMimeData, QByteArray, QSortFilterProxyModel, QCoreApplication,
-    QBuffer, QMargins, pyqtProperty
+    Qt, QThread, pyqtSignal, QRunnable, QThreadPool,
+    QStandardPaths, QSettings, QObject, QTimer,
+    QPropertyAnimation, QEasingCurve, QRect, QPoint,
+    QPointF
 )
 from PyQt6.QtGui import (
-    QFont, QIcon, QColor, QPalette, QTextOption, QTextDocument,
-    QSyntaxHighlighter, QTextCharFormat, QBrush, QAction, QPixmap,
-    QPainter, QRadialGradient, QLinearGradient, QPen, QCursor,
-    QTextCursor, QFontMetrics, QImage, QGuiApplication, QShortcut,
-    QKeySequence, QTransform, QPainterPath, QTextFormat
+    QFont, QColor,
+    QSyntaxHighlighter, QTextCharFormat, QAction,
+    QPainter, QCursor, QShortcut, QKeySequence
 )
 
 # Initialize QApplication at the module level for global settings
@@ -302,7 +584,7 @@ QTreeWidget::item:selected {
     color: #000000;
 }
 
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     border: 1px solid #c0c0c0;
     border-radius: 4px;
     background-color: #ffffff;
@@ -400,6 +682,12 @@ QStatusBar {
     color: #333333;
 }
 
+QStatusBar#animatedStatusBar {
+    border-top: 1px solid #e0e0e0;
+    padding: 4px;
+    background-color: #f8f8f8;
+}
+
 QToolTip {
     background-color: #2a2a2a;
     color: #ffffff;
@@ -483,6 +771,10 @@ QLabel[subtitle="true"] {
 
 """
 
+# Parsed once for the whole application; widgets inherit it rather than
+# carrying their own copies
+app.setStyleSheet(APP_STYLESHEET)
+
 
 # Material Design-inspired color palette
 class AppColors:
@@ -503,109 +795,213 @@ class AppColors:
 
 
 # Syntax highlighter for code preview
+# Files larger than this (in KB, configurable in Preferences) are previewed without
+# syntax highlighting, and previews are cut off after this many lines
+DEFAULT_HIGHLIGHT_LIMIT_KB = 256
+PREVIEW_MAX_LINES = 5000
+# Bytes read from a file for its preview; the rest is never read or decoded
+PREVIEW_MAX_BYTES = 1024 * 1024
+
+
+def read_preview_text(file_path):
+    """Return (text, more) for the head of a UTF-8 file; more is True if it continues."""
+    with open(file_path, 'rb') as f:
+        data = f.read(PREVIEW_MAX_BYTES + 1)
+    more = len(data) > PREVIEW_MAX_BYTES
+    # One decode of the raw bytes instead of text-mode reads; the incremental decoder
+    # leaves a character cut at the limit undecoded rather than failing on it
+    text = codecs.getincrementaldecoder('utf-8')().decode(
+        memoryview(data)[:PREVIEW_MAX_BYTES], final=not more)
+    # Match text mode's universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, more
+
+
 class CodeSyntaxHighlighter(QSyntaxHighlighter):
+    KEYWORDS = (
+        "def", "class", "import", "from", "return",
+        "if", "elif", "else", "for", "while",
+        "try", "except", "finally", "raise", "with",
+        "as", "pass", "continue", "break", "yield",
+        "lambda", "global", "nonlocal", "assert", "del"
+    )
+
+    # (group name, pattern) fused into a single alternation compiled once for the
+    # class, so each block is scanned once. Where matches overlap the earlier
+    # alternative wins, e.g. a '#' inside a string stays a string and "class Name"
+    # beats the keyword.
+    RULES = (
+        ("comment", r"#[^\n]*"),
+        ("string", r"'[^'\\]*(?:\\.[^'\\]*)*'" "|" r'"[^"\\]*(?:\\.[^"\\]*)*"'),
+        ("class_name", r"\bclass\s+[A-Za-z0-9_]+\b"),
+        ("keyword", r"\b(?:" + "|".join(KEYWORDS) + r")\b"),
+        ("function", r"\b[A-Za-z0-9_]+(?=\s*\()"),
+        ("number", r"\b[0-9]+\b"),
+    )
+    REGEX = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in RULES))
+
     def __init__(self, document):
         super().__init__(document)
 
-        self.highlighting_rules = []
-
         # Keyword format
         keyword_format = QTextCharFormat()
         keyword_format.setForeground(QColor("#0000FF"))
         keyword_format.setFontWeight(QFont.Weight.Bold)
-        keywords = [
-            "\\bdef\\b", "\\bclass\\b", "\\bimport\\b", "\\bfrom\\b", "\\breturn\\b",
-            "\\bif\\b", "\\belif\\b", "\\belse\\b", "\\bfor\\b", "\\bwhile\\b",
-            "\\btry\\b", "\\bexcept\\b", "\\bfinally\\b", "\\braise\\b", "\\bwith\\b",
-            "\\bas\\b", "\\bpass\\b", "\\bcontinue\\b", "\\bbreak\\b", "\\byield\\b",
-            "\\blambda\\b", "\\bglobal\\b", "\\bnonlocal\\b", "\\bassert\\b", "\\bdel\\b"
-        ]
 
-        for pattern in keywords:
-            rule = (pattern, keyword_format)
-            self.highlighting_rules.append(rule)
-
-        # String format (single quotes)
+        # String format (single and double quotes)
         string_format = QTextCharFormat()
         string_format.setForeground(QColor("#008000"))
-        self.highlighting_rules.append((r"'[^'\\]*(\\.[^'\\]*)*'", string_format))
-
-        # String format (double quotes)
-        self.highlighting_rules.append((r'"[^"\\]*(\\.[^"\\]*)*"', string_format))
 
         # Comment format
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor("#808080"))
         comment_format.setFontItalic(True)
-        self.highlighting_rules.append((r"#[^\n]*", comment_format))
 
         # Number format
         number_format = QTextCharFormat()
         number_format.setForeground(QColor("#FF8000"))
-        self.highlighting_rules.append((r"\b[0-9]+\b", number_format))
 
         # Function format
         function_format = QTextCharFormat()
         function_format.setForeground(QColor("#800080"))
         function_format.setFontWeight(QFont.Weight.Bold)
-        self.highlighting_rules.append((r"\b[A-Za-z0-9_]+(?=\s*\()", function_format))
 
         # Class format
         class_format = QTextCharFormat()
         class_format.setForeground(QColor("#800000"))
         class_format.setFontWeight(QFont.Weight.Bold)
-        self.highlighting_rules.append((r"\bclass\s+[A-Za-z0-9_]+\b", class_format))
+
+        # Format for each rule's group name
+        self._fmt_by_name = {
+            "comment": comment_format,
+            "string": string_format,
+            "class_name": class_format,
+            "keyword": keyword_format,
+            "function": function_format,
+            "number": number_format,
+        }
+
+        # Repeated lines (imports, blank or boilerplate lines, rehighlights while
+        # scrolling) reuse their ranges instead of running the regex again
+        self._line_ranges = lru_cache(maxsize=4096)(self._compute_ranges)
+
+    def _compute_ranges(self, text):
+        """Return the (start, length, group name) ranges to format in a line."""
+        return tuple((match.start(), match.end() - match.start(), match.lastgroup)
+                     for match in self.REGEX.finditer(text))
 
     def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            expression = pattern
-            index = text.find(expression[0]) if isinstance(expression, str) else text.indexOf(expression)
-            while index >= 0:
-                length = len(expression) if isinstance(expression, str) else expression.matchedLength()
-                self.setFormat(index, length, format)
-                index = text.find(expression, index + length) if isinstance(expression, str) else text.indexOf(
-                    expression, index + length)
+        fmt_by_name = self._fmt_by_name
+        for start, length, name in self._line_ranges(text):
+            self.setFormat(start, length, fmt_by_name[name])
 
         self.setCurrentBlockState(0)
 
 
+# Tree item type labels (column 1) and the placeholder row shown under unloaded folders
+ITEM_TYPE_FOLDER = "folder"
+ITEM_TYPE_TEXT = "text"
+ITEM_TYPE_BINARY = "binary"
+FILE_ITEM_TYPES = frozenset({ITEM_TYPE_TEXT, ITEM_TYPE_BINARY})
+LOADING_PLACEHOLDER = "Loading..."
+# Item data role holding a lazily loaded item's absolute filesystem path
+ITEM_PATH_ROLE = Qt.ItemDataRole.UserRole
+
+
+# Common text file extensions (lowercase, with leading dot)
+TEXT_EXTENSIONS = frozenset({
+    '.py', '.txt', '.md', '.json', '.yaml', '.yml', '.csv',
+    '.ini', '.cfg', '.conf', '.html', '.css', '.scss', '.sass',
+    '.js', '.jsx', '.ts', '.tsx', '.vue', '.env', '.gitignore',
+    '.xml', '.sql', '.sh', '.bash', '.bat', '.ps1', '.toml',
+    '.rst', '.asciidoc', '.tex', '.properties', '.gradle', '.sbt',
+    '.maven', '.cmake', '.dockerfile', '.makefile', '.swift',
+    '.kt', '.kts', '.java', '.c', '.cpp', '.h', '.hpp', '.cs',
+    '.php', '.rb', '.pl', '.go', '.rs', '.dart', '.lua', '.r', '.m'
+})
+
+# Extensions that are always binary, so their content is never sniffed
+BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.tif', '.tiff',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar', '.jar', '.war', '.whl',
+    '.exe', '.dll', '.so', '.dylib', '.o', '.a', '.lib', '.obj', '.class',
+    '.pyc', '.pyo', '.pyd', '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv', '.flac', '.ogg',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.ttf', '.otf', '.woff', '.woff2', '.eot', '.sqlite', '.sqlite3'
+})
+
+
+# Bytes that may appear in text: printable ASCII, common control characters
+# (BEL, BS, TAB, LF, FF, CR, ESC) and everything >= 0x80 so UTF-8/Latin-1 pass
+_TEXT_CHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+# Bytes read from the start of a file when sniffing for text
+SNIFF_BYTES = 1024
+
+
 # Determine if a file is a text file
 def is_text_file(file_path):
-    # Common text file extensions
-    text_extensions = {
-        '.py', '.txt', '.md', '.json', '.yaml', '.yml', '.csv',
-        '.ini', '.cfg', '.conf', '.html', '.css', '.js', '.jsx',
-        '.ts', '.tsx', '.env', '.gitignore', '.xml', '.sql',
-        '.sh', '.bat', '.ps1', '.toml', '.rst', '.asciidoc',
-        '.properties', '.gradle', '.swift', '.kt', '.kts',
-        '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.php',
-        '.rb', '.pl', '.go', '.rs', '.dart', '.lua', '.r'
-    }
-
-    # Try to determine MIME type
-    mime_type, _ = mimetypes.guess_type(file_path)
-
-    # Check if extension suggests text file
+    # Known extensions decide without a MIME lookup or opening the file
     ext = os.path.splitext(file_path)[1].lower()
-    if ext in text_extensions:
+    if ext in TEXT_EXTENSIONS:
         return True
+    if ext in BINARY_EXTENSIONS:
+        return False
 
     # Check if MIME type suggests text file
+    mime_type, _ = mimetypes.guess_type(file_path)
     if mime_type and mime_type.startswith(('text/', 'application/json', 'application/xml')):
         return True
 
-    # Try to read file as text if not determined by extension or MIME
+    # Sniff the first bytes if not determined by extension or MIME; the verdict is
+    # cached per file version, so rescanning an unchanged tree skips the read
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            sample = f.read(1024)
-            # Check if sample contains mostly ASCII characters
-            if all(ord(c) < 128 for c in sample if c not in '\r\n\t'):
-                return True
-            return False
-    except:
+        st = os.stat(file_path)
+        return _sniff_is_text(file_path, st.st_mtime_ns, st.st_size)
+    except OSError:
         return False
 
 
+@lru_cache(maxsize=8192)
+def _sniff_is_text(file_path, mtime_ns, size):
+    """Return True if the file's first bytes are all text bytes."""
+    # Only a bounded prefix is read: deleting every text byte (a C-level scan)
+    # leaves nothing behind for a text file
+    with open(file_path, 'rb') as f:
+        sample = f.read(SNIFF_BYTES)
+    return not sample.translate(None, _TEXT_CHARS)
+
+
+# When collecting files, those with unrecognized extensions are sniffed on a thread
+# pool once there are more than this many; sniffing is I/O-bound, so it oversubscribes
+SNIFF_PARALLEL_MIN_FILES = 16
+SNIFF_WORKERS = min(32, CPU_COUNT * 4)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+# Many files in a tree share a size, so repeated formatting is cached
+@lru_cache(maxsize=8192)
+def format_size(size):
+    """Format a byte count in human-readable form."""
+    # Every factor of 1024 adds 10 bits, so the bit length picks the unit directly
+    unit = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+
+
+DEFAULT_EXCLUDE_PATTERNS = "*.pyc, __pycache__, .git, .vscode, .idea"
+
+
+def compile_exclude_patterns(patterns):
+    """Compile comma-separated glob patterns into one name matcher, or None if empty."""
+    globs = [pattern.strip() for pattern in patterns.split(',') if pattern.strip()]
+    if not globs:
+        return None
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(fnmatch.translate(glob) for glob in globs), flags).match
+
+
 # Loading overlay widget
 class LoadingOverlay(QWidget):
     def __init__(self, parent=None):
@@ -613,11 +1009,21 @@ class LoadingOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        # Set up animation timer
+        # Set up animation timer (only runs while the overlay is visible)
         self.angle = 0
         self.timer = QTimer(self)
+        self.timer.setInterval(40)  # Update every 40ms for smooth animation
         self.timer.timeout.connect(self.rotate)
-        self.timer.start(40)  # Update every 40ms for smooth animation
+
+        # Spinner petal centres and colours, computed once instead of per frame
+        radius = 30
+        self._petals = [
+            (QPointF(math.cos(math.radians(i * 45)) * radius,
+                     math.sin(math.radians(i * 45)) * radius),
+             QColor(0, 122, 255, max(0, 255 - i * 32)))
+            for i in range(8)
+        ]
+        self._background_color = QColor(255, 255, 255, 180)
 
         # Label for loading text
         self.text_label = QLabel(self)
@@ -648,27 +1054,17 @@ class LoadingOverlay(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Semi-transparent background
-        painter.fillRect(event.rect(), QColor(255, 255, 255, 180))
+        painter.fillRect(event.rect(), self._background_color)
 
         # Draw loading spinner
         center = QPoint(self.width() // 2, self.height() // 2 - 40)
-        radius = 30
         painter.translate(center)
         painter.rotate(self.angle)
+        painter.setPen(Qt.PenStyle.NoPen)
 
-        for i in range(8):
-            painter.save()
-            painter.rotate(i * 45)
-            painter.translate(radius, 0)
-
-            alpha = 255 - (i * 32)
-            if alpha < 0:
-                alpha = 0
-
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(0, 122, 255, alpha))
-            painter.drawEllipse(-5, -5, 10, 10)
-            painter.restore()
+        for petal_center, color in self._petals:
+            painter.setBrush(color)
+            painter.drawEllipse(petal_center, 5, 5)
 
     def show_loading(self, text="Loading..."):
         self.text_label.setText(text)
@@ -678,6 +1074,14 @@ class LoadingOverlay(QWidget):
     def hide_loading(self):
         super().hide()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.text_label.setGeometry(
@@ -814,11 +1218,14 @@ class FileTreeWidget(QTreeWidget):
         self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
         self.setAlternatingRowColors(True)
         self.setAnimated(True)
+        # All rows are single-line, so the view can skip per-row size hints
+        self.setUniformRowHeights(True)
         self.setHeaderLabels(["File/Folder", "Type", "Size"])
         self.setColumnWidth(0, 300)
 
-        # Improve hit test areas for checkboxes
-        self.checkbox_rect_cache = {}
+        # Reused hit-test rect for checkbox clicks (checkbox sits in the first ~20px of the item)
+        self._checkbox_rect = QRect()
+        self._checkbox_width = 20
 
         # Enable drag and drop for file ordering
         self.setDragEnabled(True)
@@ -840,6 +1247,27 @@ class FileTreeWidget(QTreeWidget):
         # Cache for loaded directories to avoid re-scanning
         self.loaded_directories = set()
 
+        # Folder listings running on the thread pool, by (generation, path); the
+        # generation changes whenever the tree is reset
+        self._pending_lists = {}
+        self._list_generation = 0
+
+        # Absolute path -> item for every lazily loaded item
+        self._path_to_item = {}
+
+        # Loaded file items per extension, kept as they are inserted so extension
+        # filters and the extension list never need a walk of the whole tree
+        self.extension_counts = Counter()
+        self._items_by_extension = defaultdict(list)
+
+        # Main window is set by the owner; extension collection is debounced
+        # so a burst of expands (e.g. "Expand All") triggers a single rescan
+        self._main_window = None
+        self._extension_timer = QTimer(self)
+        self._extension_timer.setSingleShot(True)
+        self._extension_timer.setInterval(100)
+        self._extension_timer.timeout.connect(self._collect_extensions)
+
         # Cache icons to avoid expensive style().standardIcon() calls
         self._icon_cache = {
             'folder': self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon),
@@ -852,47 +1280,33 @@ class FileTreeWidget(QTreeWidget):
         self.itemExpanded.connect(self.on_item_expanded)
 
     def handle_item_clicked(self, item, column):
-        # Get click position
-        pos = self.mapFromGlobal(QCursor.pos())
-
-        # Get item rect and check if click was in the checkbox area
-        rect = self.visualItemRect(item)
-
-        # Checkbox is typically in the first 20-25 pixels of the item
-        checkbox_rect = QRect(rect.left() + 2, rect.top() + 2, 20, rect.height() - 4)
-
-        # If click was in the checkbox area, toggle the checkbox state
-        if checkbox_rect.contains(pos) and column == 0 and item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-            current_state = item.checkState(0)
-            new_state = Qt.CheckState.Unchecked if current_state == Qt.CheckState.Checked else Qt.CheckState.Checked
-            item.setCheckState(0, new_state)
-        else:
-            # Otherwise emit signal for file click
-            if item.text(1) == "text":
-                # Use the new get_item_path method for consistency
-                full_path = self.get_item_path(item)
-                self.fileClicked.emit(full_path)
-
-    def mousePressEvent(self, event):
-        item = self.itemAt(event.pos())
-        if item:
-            # Get item rect and check if click was in the checkbox area
+        # Only column 0 of checkable items has a checkbox worth hit-testing
+        if column == 0 and item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            # Get click position and check if it was in the checkbox area
+            pos = self.mapFromGlobal(QCursor.pos())
             rect = self.visualItemRect(item)
+            self._checkbox_rect.setRect(rect.left() + 2, rect.top() + 2, self._checkbox_width, rect.height() - 4)
 
-            # Checkbox is typically in the first 20-25 pixels of the item
-            checkbox_rect = QRect(rect.left() + 2, rect.top() + 2, 20, rect.height() - 4)
+            # If click was in the checkbox area, toggle the checkbox state
+            if self._checkbox_rect.contains(pos):
+                current_state = item.checkState(0)
+                new_state = Qt.CheckState.Unchecked if current_state == Qt.CheckState.Checked else Qt.CheckState.Checked
+                item.setCheckState(0, new_state)
+                return
 
-            if checkbox_rect.contains(event.pos()) and item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-                # Handle in clicked event
-                super().mousePressEvent(event)
-            else:
-                # Pass to parent for selection
-                super().mousePressEvent(event)
-        else:
-            super().mousePressEvent(event)
+        # Otherwise emit signal for file click
+        if item.text(1) == ITEM_TYPE_TEXT:
+            # Use the new get_item_path method for consistency
+            full_path = self.get_item_path(item)
+            self.fileClicked.emit(full_path)
 
     def get_item_path(self, item):
         """Get the full filesystem path for a tree item."""
+        # Lazily loaded items carry their path; others rebuild it from their ancestors
+        path = item.data(0, ITEM_PATH_ROLE)
+        if path is not None:
+            return path
+
         path_parts = []
         temp_item = item
         while temp_item is not None:
@@ -906,6 +1320,31 @@ class FileTreeWidget(QTreeWidget):
         else:
             return self.root_path
 
+    def find_item(self, path):
+        """Return the loaded item for an absolute path, or None if it is not in the tree."""
+        item = self._path_to_item.get(path)
+        if item is None:
+            return None
+        try:
+            # Items removed by a folder refresh are no longer attached to the tree
+            return item if item.treeWidget() is self else None
+        except RuntimeError:
+            return None
+
+    def set_extension_hidden(self, extension, hidden):
+        """Show or hide every loaded file item with the given extension."""
+        self.setUpdatesEnabled(False)
+        try:
+            for item in self._items_by_extension.get(extension, ()):
+                item.setHidden(hidden)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def is_extension_ignored(self, item):
+        """Return True if item is a file whose extension is filtered out."""
+        return (item.text(1) in FILE_ITEM_TYPES
+                and os.path.splitext(item.text(0))[1].lower() in self.ignored_extensions)
+
     def on_item_expanded(self, item):
         """Lazy load folder contents when a folder is expanded."""
         # Get the full path of this item
@@ -918,240 +1357,308 @@ class FileTreeWidget(QTreeWidget):
         # Mark as loaded to avoid re-scanning
         self.loaded_directories.add(item_path)
 
+        # List the folder on the thread pool; the placeholder shows until it arrives
+        task = FolderListTask(self._list_generation, item_path)
+        task.signals.folder_listed.connect(self._on_folder_listed)
+        self._pending_lists[(self._list_generation, item_path)] = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_folder_listed(self, generation, item_path, entries):
+        """Fill an expanded folder with the listing made by FolderListTask."""
+        self._pending_lists.pop((generation, item_path), None)
+        # Listings started before the tree was reset belong to items that are gone
+        if generation != self._list_generation:
+            return
+        item = self.find_item(item_path)
+        if item is None:
+            return
+
         # Remove placeholder if it exists
-        if item.childCount() == 1 and item.child(0).text(0) == "Loading...":
+        if item.childCount() == 1 and item.child(0).text(0) == LOADING_PLACEHOLDER:
             item.removeChild(item.child(0))
 
         # Load contents
-        self.load_folder_contents(item, item_path)
+        self.load_folder_contents(item, item_path, entries)
 
         # Trigger extension collection update in main window
-        # This is a bit hacky, but we need to notify the main window
-        try:
-            main_window = self.parent()
-            while main_window and not isinstance(main_window, QMainWindow):
-                main_window = main_window.parent()
-            if main_window and hasattr(main_window, 'collect_and_display_extensions'):
-                main_window.collect_and_display_extensions()
-        except:
-            pass  # Silently fail if we can't find the main window
+        if self._main_window:
+            self._debounce_collect()
+
+    def set_main_window(self, window):
+        """Set the main window notified when new folders are loaded."""
+        self._main_window = window
+
+    def _debounce_collect(self):
+        """Restart the extension collection timer so rapid expands coalesce."""
+        self._extension_timer.start()
+
+    def _collect_extensions(self):
+        """Ask the main window to refresh the extension filter list."""
+        if self._main_window:
+            self._main_window.collect_and_display_extensions()
 
     @log_performance
-    def load_folder_contents(self, parent_item, folder_path):
-        """Load the immediate contents of a folder (non-recursive)."""
+    def load_folder_contents(self, parent_item, folder_path, entries=None):
+        """Load the immediate contents of a folder (non-recursive).
+
+        entries, if given, is a scandir listing of folder_path made in advance
+        (e.g. by FolderListTask on a pool thread) and is used instead of listing it here.
+        """
         perf_logger.info(f"Loading folder: {folder_path}")
         start_time = time.perf_counter()
 
         # Block signals during initial load to prevent cascade
         self.blockSignals(True)
+        updates_were_enabled = self.updatesEnabled()
 
         try:
-            path = Path(folder_path)
-            if not path.exists() or not path.is_dir():
+            if not os.path.isdir(folder_path):
                 logger.warning(f"Folder does not exist or is not a directory: {folder_path}")
                 return
 
-            # List directory contents
+            # List directory contents (scandir entries cache the file type from the listing)
             list_start = time.perf_counter()
-            try:
-                items = list(path.iterdir())
-            except PermissionError as e:
-                logger.error(f"Permission denied accessing folder: {folder_path}")
-                return
+            if entries is not None:
+                items = list(entries)
+            else:
+                try:
+                    with os.scandir(folder_path) as it:
+                        items = list(it)
+                except PermissionError:
+                    logger.error(f"Permission denied accessing folder: {folder_path}")
+                    return
             list_elapsed = time.perf_counter() - list_start
             perf_logger.debug(f"Directory listing took {list_elapsed:.4f}s for {len(items)} items")
 
             # Sort: directories first, then files alphabetically
             sort_start = time.perf_counter()
-            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+            items.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
             sort_elapsed = time.perf_counter() - sort_start
             perf_logger.debug(f"Sorting took {sort_elapsed:.4f}s")
 
             files_processed = 0
             dirs_processed = 0
 
-            for item_path in items:
+            # Build parentless items and attach them in one addChildren call
+            new_items = []
+            append_item = new_items.append
+            self.setUpdatesEnabled(False)
+
+            # Hoist attribute lookups out of the per-entry loop
+            ignored_extensions = self.ignored_extensions
+            quick_file_type_check = self._quick_file_type_check
+            format_file_size = self.format_file_size
+            splitext = os.path.splitext
+            icon_folder = self._icon_cache['folder']
+            icon_file = self._icon_cache['file']
+            icon_binary = self._icon_cache['binary']
+            path_to_item = self._path_to_item
+            extension_counts = self.extension_counts
+            items_by_extension = self._items_by_extension
+            hidden_items = []
+            # Every new item starts with the same default flags, so combine them once
+            checkable_flags = QTreeWidgetItem().flags() | Qt.ItemFlag.ItemIsUserCheckable
+            no_flags = Qt.ItemFlag.NoItemFlags
+
+            # Both modes start UNCHECKED:
+            # - Normal mode: unchecked = included, user checks to exclude
+            # - Reverse mode: unchecked = excluded, user checks to include
+            initial_state = Qt.CheckState.Unchecked
+
+            for entry in items:
                 try:
-                    item_name = item_path.name
+                    item_name = entry.name
+                    item_path = entry.path
 
-                    if item_path.is_dir():
+                    if entry.is_dir():
                         # Create directory item
-                        dir_item = QTreeWidgetItem(parent_item, [item_name, "folder", ""])
-                        dir_item.setIcon(0, self._icon_cache['folder'])
-                        dir_item.setFlags(dir_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-
-                        # Set initial check state
-                        # Both modes start UNCHECKED:
-                        # - Normal mode: unchecked = included, user checks to exclude
-                        # - Reverse mode: unchecked = excluded, user checks to include
-                        initial_state = Qt.CheckState.Unchecked
+                        dir_item = QTreeWidgetItem([item_name, ITEM_TYPE_FOLDER, ""])
+                        dir_item.setData(0, ITEM_PATH_ROLE, item_path)
+                        path_to_item[item_path] = dir_item
+                        dir_item.setIcon(0, icon_folder)
+                        dir_item.setFlags(checkable_flags)
                         dir_item.setCheckState(0, initial_state)
 
                         # Add a placeholder child to make it expandable
-                        placeholder = QTreeWidgetItem(dir_item, ["Loading...", "", ""])
-                        placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+                        placeholder = QTreeWidgetItem(dir_item, [LOADING_PLACEHOLDER, "", ""])
+                        placeholder.setFlags(no_flags)
 
+                        append_item(dir_item)
                         dirs_processed += 1
 
                     else:
                         # Get file extension
-                        extension = item_path.suffix.lower()
-
-                        # Skip if extension is ignored
-                        if extension in self.ignored_extensions:
-                            continue
+                        extension = splitext(item_name)[1].lower()
 
                         # OPTIMIZATION: Skip expensive is_text_file check during initial load
                         # Instead, do a quick heuristic based on extension
-                        file_type = self._quick_file_type_check(item_path)
+                        file_type = quick_file_type_check(extension)
 
                         # Get file size (fast operation)
                         try:
-                            file_size = item_path.stat().st_size
-                            size_str = self.format_file_size(file_size)
-                        except:
+                            size_str = format_file_size(entry.stat().st_size)
+                        except OSError:
                             size_str = "?"
 
-                        # Create file item
-                        file_item = QTreeWidgetItem(parent_item, [item_name, file_type, size_str])
-
-                        # Set icon based on type (using cached icons)
-                        if file_type == "text":
-                            file_item.setIcon(0, self._icon_cache['file'])
-                        else:
-                            file_item.setIcon(0, self._icon_cache['binary'])
+                        # Create file item with its icon (using cached icons)
+                        file_item = QTreeWidgetItem([item_name, file_type, size_str])
+                        file_item.setData(0, ITEM_PATH_ROLE, item_path)
+                        path_to_item[item_path] = file_item
+                        file_item.setIcon(0, icon_file if file_type == ITEM_TYPE_TEXT else icon_binary)
 
                         # Make checkable
-                        file_item.setFlags(file_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-
-                        # Set initial check state
-                        # Both modes start UNCHECKED:
-                        # - Normal mode: unchecked = included, user checks to exclude
-                        # - Reverse mode: unchecked = excluded, user checks to include
-                        initial_state = Qt.CheckState.Unchecked
+                        file_item.setFlags(checkable_flags)
                         file_item.setCheckState(0, initial_state)
 
+                        append_item(file_item)
                         files_processed += 1
 
+                        # Index by extension; files of ignored extensions are loaded hidden
+                        extension_counts[extension] += 1
+                        items_by_extension[extension].append(file_item)
+                        if extension in ignored_extensions:
+                            hidden_items.append(file_item)
+
                 except Exception as e:
-                    logger.error(f"Error processing {item_path}: {e}")
-                    logger.debug(traceback.format_exc())
+                    logger.error(f"Error processing {entry.path}: {e}")
+                    logger.debug(f"Traceback for {entry.path}", exc_info=True)
                     continue
 
+            parent_item.addChildren(new_items)
+            # Items can only be hidden once they are in the tree
+            for file_item in hidden_items:
+                file_item.setHidden(True)
+
             elapsed = time.perf_counter() - start_time
             perf_logger.info(f"Loaded {dirs_processed} dirs and {files_processed} files in {elapsed:.4f}s")
 
         except Exception as e:
             logger.error(f"Error loading folder {folder_path}: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug(f"Traceback for {folder_path}", exc_info=True)
         finally:
-            # Always unblock signals
+            # Always unblock signals and restore painting (a caller may be batching)
             self.blockSignals(False)
+            self.setUpdatesEnabled(updates_were_enabled)
 
-    def _quick_file_type_check(self, file_path):
-        """Fast heuristic to determine if file is likely text or binary based on extension."""
-        # Common text file extensions
-        text_extensions = {
-            '.txt', '.py', '.js', '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.rb',
-            '.go', '.rs', '.php', '.html', '.css', '.scss', '.sass', '.xml', '.json',
-            '.yaml', '.yml', '.md', '.rst', '.tex', '.sh', '.bash', '.ps1', '.bat',
-            '.sql', '.r', '.m', '.swift', '.kt', '.ts', '.jsx', '.tsx', '.vue',
-            '.toml', '.ini', '.cfg', '.conf', '.properties', '.env', '.gitignore',
-            '.dockerfile', '.makefile', '.cmake', '.gradle', '.sbt', '.maven'
-        }
-
-        ext = file_path.suffix.lower()
-        if ext in text_extensions:
-            return "text"
+    def _quick_file_type_check(self, ext):
+        """Fast heuristic to determine if file is likely text or binary based on its (lowercase) extension."""
+        if ext in TEXT_EXTENSIONS:
+            return ITEM_TYPE_TEXT
 
         # If unknown, mark as binary (safer default)
         # Can be verified later when actually processing
-        return "binary"
+        return ITEM_TYPE_BINARY
 
     def format_file_size(self, size):
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        return format_size(size)
 
     @log_performance
-    def set_root_folder(self, folder_path):
-        """Initialize the tree with a root folder (lazy loading)."""
+    def set_root_folder(self, folder_path, entries=None):
+        """Initialize the tree with a root folder (lazy loading).
+
+        entries is an optional pre-made scandir listing of the root folder.
+        """
         logger.info(f"Setting root folder: {folder_path}")
         perf_logger.info(f"Root folder: {folder_path}")
 
         self.clear()
         self.root_path = folder_path
         self.loaded_directories.clear()
+        self._list_generation += 1
         self.ignored_items.clear()
+        self._path_to_item.clear()
+        self.extension_counts.clear()
+        self._items_by_extension.clear()
 
-        # Block signals during root setup to prevent cascade
-        self.blockSignals(True)
-
-        # Create root item
-        root_name = os.path.basename(folder_path)
-        root_item = QTreeWidgetItem(self, [root_name, "folder", ""])
-        root_item.setIcon(0, self._icon_cache['folder'])
-        root_item.setFlags(root_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        # Both modes start unchecked (normal: unchecked = include, reverse: unchecked = exclude)
-        root_item.setCheckState(0, Qt.CheckState.Unchecked)
-
-        # Load immediate contents of root
-        self.loaded_directories.add(folder_path)
-        self.load_folder_contents(root_item, folder_path)
-
-        # Unblock signals before expanding (expansion should be normal)
-        self.blockSignals(False)
+        # Suspend painting for the whole setup so the tree redraws once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # Block signals during root setup to prevent cascade
+            self.blockSignals(True)
+
+            # Create root item
+            root_name = os.path.basename(folder_path)
+            root_item = QTreeWidgetItem(self, [root_name, ITEM_TYPE_FOLDER, ""])
+            root_item.setData(0, ITEM_PATH_ROLE, folder_path)
+            self._path_to_item[folder_path] = root_item
+            root_item.setIcon(0, self._icon_cache['folder'])
+            root_item.setFlags(root_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            # Both modes start unchecked (normal: unchecked = include, reverse: unchecked = exclude)
+            root_item.setCheckState(0, Qt.CheckState.Unchecked)
+
+            # Load immediate contents of root
+            self.loaded_directories.add(folder_path)
+            self.load_folder_contents(root_item, folder_path, entries)
+
+            # Unblock signals before expanding (expansion should be normal)
+            self.blockSignals(False)
 
-        # Expand root
-        self.expandItem(root_item)
+            # Expand root
+            self.expandItem(root_item)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
-        logger.info(f"Root folder loaded successfully")
+        logger.info("Root folder loaded successfully")
 
 
 # Custom status bar with animation support
 class AnimatedStatusBar(QStatusBar):
+    FADE_DURATION = 0.5  # seconds
+    FADE_INTERVAL_MS = 16  # ~60 Hz
+    MIN_VISIBLE_ALPHA = 4  # below this the overlay is invisible, so painting is skipped
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Initialize alpha BEFORE creating QPropertyAnimation (animation needs to read the property)
-        self.__alpha = 255  # Use double underscore for internal storage
+        self._alpha_value = 255
         self._temp_message = ""
         self._base_message = ""
+        self._fade_color = QColor(248, 248, 248, 128)
 
-        # Animation properties (created AFTER __alpha is initialized)
-        self.fade_animation = QPropertyAnimation(self, b"_alpha")
-        self.fade_animation.setDuration(500)
-        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.fade_animation.finished.connect(self._on_fade_finished)
-
-        # Style
-        self.setStyleSheet("""
-            QStatusBar {
-                border-top: 1px solid #e0e0e0;
-                padding: 4px;
-                background-color: #f8f8f8;
-            }
-        """)
+        # Fade is driven by a plain timer stepping an integer alpha
+        self._fade_from = 255
+        self._fade_to = 255
+        self._fade_started = 0.0
+        self._fade_timer = QTimer(self)
+        self._fade_timer.setInterval(self.FADE_INTERVAL_MS)
+        self._fade_timer.timeout.connect(self._fade_step)
+
+        # Style comes from the application stylesheet
+        self.setObjectName("animatedStatusBar")
 
-    # Property for animation - using pyqtProperty for Qt's meta-object system
     def get_alpha(self):
-        return self.__alpha
+        return self._alpha_value
 
     def set_alpha(self, value):
-        self.__alpha = value
-        self.update()
-
-    _alpha = pyqtProperty(int, fget=get_alpha, fset=set_alpha)
+        # Eased steps repeat integer values near their ends; only repaint on change
+        if value != self._alpha_value:
+            self._alpha_value = value
+            self.update()
+
+    def _start_fade(self, start, end):
+        self._fade_from = start
+        self._fade_to = end
+        self._fade_started = time.monotonic()
+        self.set_alpha(start)
+        self._fade_timer.start()
+
+    def _fade_step(self):
+        t = (time.monotonic() - self._fade_started) / self.FADE_DURATION
+        if t >= 1.0:
+            self._fade_timer.stop()
+            self.set_alpha(self._fade_to)
+            self._on_fade_finished()
+            return
+        # Out-cubic easing, as the property animation used
+        eased = 1.0 - (1.0 - t) ** 3
+        self.set_alpha(int(self._fade_from + (self._fade_to - self._fade_from) * eased))
 
     def _on_fade_finished(self):
-        if self._alpha == 0:
+        if self._alpha_value == 0:
             super().showMessage(self._base_message)
-            self.fade_animation.setStartValue(0)
-            self.fade_animation.setEndValue(255)
-            self.fade_animation.start()
+            self._start_fade(0, 255)
 
     def showMessage(self, message, timeout=0):
         self._base_message = message
@@ -1161,7 +1668,7 @@ class AnimatedStatusBar(QStatusBar):
         self._temp_message = message
 
         # Stop any current animation
-        self.fade_animation.stop()
+        self._fade_timer.stop()
 
         # Show temporary message
         super().showMessage(message)
@@ -1170,18 +1677,43 @@ class AnimatedStatusBar(QStatusBar):
         QTimer.singleShot(timeout, self._start_fade_out)
 
     def _start_fade_out(self):
-        self.fade_animation.setStartValue(255)
-        self.fade_animation.setEndValue(0)
-        self.fade_animation.start()
+        self._start_fade(255, 0)
 
     def paintEvent(self, event):
         super().paintEvent(event)
 
         # If we're animating a fade, apply transparency
-        if self.fade_animation.state() == QPropertyAnimation.State.Running:
+        if self._fade_timer.isActive() and self._alpha_value >= self.MIN_VISIBLE_ALPHA:
             painter = QPainter(self)
-            painter.setOpacity(self._alpha / 255.0)
-            painter.fillRect(event.rect(), QColor(248, 248, 248, 128))
+            painter.setOpacity(self._alpha_value * (1.0 / 255.0))
+            painter.fillRect(event.rect(), self._fade_color)
+
+
+# Files read per thread-pool task when combining in parallel, and how many of
+# those batches may be read ahead of the writer
+READ_BATCH_SIZE = 32
+READ_AHEAD_BATCHES = 4
+# How often a writer blocked on a read batch re-checks for cancellation
+CANCEL_POLL_SECONDS = 0.1
+# Write buffer for the combined output file, and the size above which source
+# files are memory-mapped rather than read into memory
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 1024 * 1024
+# Progress and current-file signals are coalesced to at most one emit per this
+# many files or this many seconds, whichever comes first
+PROGRESS_EMIT_FILES = 32
+PROGRESS_EMIT_SECONDS = 0.05
+
+# Fixed pieces of the combined output, encoded once (the output is written in binary mode)
+OUTPUT_NEWLINE = os.linesep.encode('ascii')
+SEPARATOR_BAR = b"=" * 80
+SEPARATOR_LINE = b"\n\n" + SEPARATOR_BAR + b"\n"
+HEADER_END = SEPARATOR_BAR + b"\n\n"
+MARKDOWN_SEPARATOR = b"\n\n"
+MARKDOWN_FOOTER = b"\n```\n"
+# The same pieces as text, for the output preview
+PREVIEW_SEPARATOR_LINE = SEPARATOR_LINE.decode('ascii')
+PREVIEW_HEADER_END = HEADER_END.decode('ascii')
 
 
 # Worker thread for processing files
@@ -1197,18 +1729,105 @@ class FileProcessorWorker(QObject):
         self.excluded_paths = excluded_paths
         self.output_file = output_file
         self.separator_style = separator_style
+        # Pick the separator renderer once so the write loop does not branch per file
+        self._render_separator = {
+            "Simple": self._render_simple,
+            "Detailed": self._render_detailed,
+        }.get(separator_style, self._render_markdown)
         self.file_list = file_list  # Optional: if provided, use this instead of scanning
         self.cancelled = False
         self.use_parallel = CPU_COUNT > 1  # Use parallel processing if multi-core
 
     def _read_file_parallel(self, file_path):
-        """Read a single file (for parallel processing)."""
+        """Read a single file (for parallel processing).
+
+        Returns (path, content, error, size, mtime). Content is the raw bytes with
+        line endings normalized to LF, or a read-only mmap for large files that need
+        no normalizing (the caller closes it); size and mtime come from an fstat on
+        the open file.
+        """
+        size = mtime = None
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return (file_path, f.read(), None)
+            with open(file_path, 'rb') as f:
+                stat_result = os.fstat(f.fileno())
+                size, mtime = stat_result.st_size, stat_result.st_mtime
+                if size > MMAP_THRESHOLD:
+                    # Map large files so their pages go from the page cache to the
+                    # output without a full-size copy on the Python heap
+                    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if content.find(b"\r") == -1:
+                        return (file_path, content, None, size, mtime)
+                    mapped = content
+                    content = mapped[:]
+                    mapped.close()
+                else:
+                    content = f.read()
+            # Files were already sniffed as text, so bytes are copied without a
+            # decode/encode round trip; only CRLF/CR endings are rewritten
+            if b"\r" in content:
+                content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            return (file_path, content, None, size, mtime)
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
-            return (file_path, None, str(e))
+            return (file_path, None, str(e), size, mtime)
+
+    def _read_file_batch(self, file_paths):
+        """Read a batch of files in one pool task."""
+        return [self._read_file_parallel(fp) for fp in file_paths]
+
+    def _iter_file_contents(self, executor, file_paths):
+        """Yield read results in order, reading at most READ_AHEAD_BATCHES batches ahead.
+
+        Stops early if processing is cancelled while waiting on a batch.
+        """
+        pending = deque()
+        for start in range(0, len(file_paths), READ_BATCH_SIZE):
+            pending.append(executor.submit(self._read_file_batch, file_paths[start:start + READ_BATCH_SIZE]))
+            if len(pending) >= READ_AHEAD_BATCHES:
+                results = self._batch_result(pending.popleft())
+                if results is None:
+                    return
+                yield from results
+        while pending:
+            results = self._batch_result(pending.popleft())
+            if results is None:
+                return
+            yield from results
+
+    def _batch_result(self, future):
+        """Wait for a read batch, returning None if processing is cancelled meanwhile."""
+        while not self.cancelled:
+            done, _ = wait((future,), timeout=CANCEL_POLL_SECONDS)
+            if done:
+                return future.result()
+        return None
+
+    def _render_simple(self, file_path, rel_path, file_size, file_time):
+        """Return (separator, header, footer) bytes for the Simple style."""
+        return SEPARATOR_LINE, f"FILE: {rel_path}\n".encode('utf-8') + HEADER_END, b""
+
+    def _render_detailed(self, file_path, rel_path, file_size, file_time):
+        """Return (separator, header, footer) bytes for the Detailed style."""
+        try:
+            # Reuse the stat taken when the file was opened; only
+            # files that failed to open need a separate stat
+            if file_size is None:
+                stat_result = os.stat(file_path)
+                file_size, file_time = stat_result.st_size, stat_result.st_mtime
+            timestamp = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M:%S')
+        except (OSError, OverflowError, ValueError):
+            file_size = 0
+            timestamp = "Unknown"
+
+        header = (f"FILE: {rel_path}\n"
+                  f"SIZE: {file_size} bytes\n"
+                  f"MODIFIED: {timestamp}\n").encode('utf-8') + HEADER_END
+        return SEPARATOR_LINE, header, b""
+
+    def _render_markdown(self, file_path, rel_path, file_size, file_time):
+        """Return (separator, header, footer) bytes for the Markdown style."""
+        ext = os.path.splitext(file_path)[1][1:] or "text"
+        return MARKDOWN_SEPARATOR, f"## {rel_path}\n\n```{ext}\n".encode('utf-8'), MARKDOWN_FOOTER
 
     @log_performance
     def process_files(self):
@@ -1220,31 +1839,32 @@ class FileProcessorWorker(QObject):
                 # Legacy mode: scan file system
                 text_files = []
 
-                # Emit initial progress
-                self.progress.emit(0, 0)
+                excluded_paths = self.excluded_paths
 
                 # Find all text files
                 for root, dirs, files in os.walk(self.root_folder):
-                    # Skip excluded directories
-                    dirs[:] = [d for d in dirs if os.path.join(root, d) not in self.excluded_paths]
-
-                    for file in files:
-                        file_path = os.path.join(root, file)
+                    # Join the directory once; children are appended by concatenation
+                    root_prefix = os.path.join(root, '')
 
-                        # Skip excluded files
-                        if file_path in self.excluded_paths:
-                            continue
+                    # Prune excluded directories so their subtrees are never walked
+                    if excluded_paths:
+                        dirs[:] = [d for d in dirs if root_prefix + d not in excluded_paths]
 
-                        self.current_file.emit(file_path)
+                    if not files:
+                        continue
+                    self.current_file.emit(root)
 
-                        if is_text_file(file_path):
-                            text_files.append(file_path)
-                            rel_path = os.path.relpath(file_path, self.root_folder)
-                            self.file_found.emit(file_path, "text")
+                    # Collect each directory's text files as one batch and extend once
+                    found = [file_path
+                             for file_path in (root_prefix + file for file in files)
+                             if file_path not in excluded_paths and is_text_file(file_path)]
+                    text_files.extend(found)
+                    for file_path in found:
+                        self.file_found.emit(file_path, ITEM_TYPE_TEXT)
 
-                        if self.cancelled:
-                            self.processing_complete.emit(False, "Operation cancelled")
-                            return
+                    if self.cancelled:
+                        self.processing_complete.emit(False, "Operation cancelled")
+                        return
 
             total_files = len(text_files)
             self.progress.emit(0, total_files)
@@ -1252,98 +1872,94 @@ class FileProcessorWorker(QObject):
             logger.info(f"Processing {total_files} files with parallel={self.use_parallel}")
             perf_logger.info(f"Starting file processing: {total_files} files, parallel={self.use_parallel}")
 
-            # Read all files in parallel (if enabled)
-            file_contents = {}
+            # Files are read just ahead of the writer, so only a bounded window of
+            # contents is held in memory rather than the whole project
             if self.use_parallel and total_files > 10:  # Only use parallel for > 10 files
                 perf_logger.info(f"Using parallel file reading with {min(CPU_COUNT, 8)} workers")
-                # Use ThreadPoolExecutor for parallel file I/O
-                with ThreadPoolExecutor(max_workers=min(CPU_COUNT, 8)) as executor:
-                    futures = {executor.submit(self._read_file_parallel, fp): fp for fp in text_files}
-
-                    for i, future in enumerate(futures):
-                        if self.cancelled:
-                            executor.shutdown(wait=False, cancel_futures=True)
-                            self.processing_complete.emit(False, "Operation cancelled")
-                            return
-
-                        file_path, content, error = future.result()
-                        file_contents[file_path] = (content, error)
-                        self.progress.emit(i + 1, total_files)
-                        self.current_file.emit(f"Reading: {os.path.relpath(file_path, self.root_folder)}")
+                executor = ThreadPoolExecutor(max_workers=min(CPU_COUNT, 8))
+                file_contents = self._iter_file_contents(executor, text_files)
             else:
                 # Sequential file reading for small numbers of files
                 perf_logger.info("Using sequential file reading")
-                for i, file_path in enumerate(text_files):
-                    if self.cancelled:
-                        self.processing_complete.emit(False, "Operation cancelled")
-                        return
-
-                    _, content, error = self._read_file_parallel(file_path)
-                    file_contents[file_path] = (content, error)
-                    self.progress.emit(i + 1, total_files)
-                    self.current_file.emit(f"Reading: {os.path.relpath(file_path, self.root_folder)}")
+                executor = None
+                file_contents = map(self._read_file_parallel, text_files)
 
             # Now write the combined output file
             perf_logger.info("Writing combined output file")
-            with open(self.output_file, 'w', encoding='utf-8') as output:
-                # Write a header at the top of the file
-                output.write(f"# Combined Code from {os.path.basename(self.root_folder)}\n")
-                output.write(f"# Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                output.write(f"# Contains {total_files} text files\n\n")
+            try:
+                with open(self.output_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as output:
+                    if OUTPUT_NEWLINE != b"\n":
+                        # Binary mode does no newline translation; match what text mode wrote
+                        def _translate_writelines(chunks, _writelines=output.writelines):
+                            _writelines([bytes(chunk).replace(b"\n", OUTPUT_NEWLINE) for chunk in chunks])
+                        writelines = _translate_writelines
+                    else:
+                        writelines = output.writelines
+
+                    # Write a header at the top of the file
+                    writelines((
+                        f"# Combined Code from {os.path.basename(self.root_folder)}\n".encode('utf-8'),
+                        f"# Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n".encode('utf-8'),
+                        f"# Contains {total_files} text files\n\n".encode('utf-8'),
+                    ))
+
+                    # Bind per-file lookups to locals for the hot loop
+                    root_folder = self.root_folder
+                    render_separator = self._render_separator
+                    relpath = os.path.relpath
+                    # Paths under the root are made relative by slicing off its prefix
+                    root_prefix = os.path.join(root_folder, '')
+                    root_prefix_len = len(root_prefix)
+                    progress_emit = self.progress.emit
+                    current_file_emit = self.current_file.emit
+                    monotonic = time.monotonic
+                    last_emit_i = -PROGRESS_EMIT_FILES  # so the first file is reported
+                    last_emit_time = monotonic()
+
+                    for i, (file_path, content, error, file_size, file_time) in enumerate(file_contents):
+                        if self.cancelled:
+                            self.processing_complete.emit(False, "Operation cancelled")
+                            return
 
-                for i, file_path in enumerate(text_files):
+                        if file_path.startswith(root_prefix):
+                            rel_path = file_path[root_prefix_len:]
+                        else:
+                            rel_path = relpath(file_path, root_folder)
+
+                        # Throttle cross-thread signals; the UI cannot show more than ~20 updates a second
+                        now = monotonic()
+                        emit_progress = (i - last_emit_i >= PROGRESS_EMIT_FILES
+                                         or now - last_emit_time > PROGRESS_EMIT_SECONDS)
+                        if emit_progress:
+                            current_file_emit(f"Writing: {rel_path}")
+
+                        # Add separator and file info
+                        separator, header, footer = render_separator(file_path, rel_path, file_size, file_time)
+
+                        # Write file content with its separator, header and footer
+                        if content is None:
+                            content = f"\n[Error reading file: {error}]\n".encode('utf-8')
+                            logger.warning(f"Failed to read file {file_path}: {error}")
+                        writelines((separator, header, content, footer))
+                        if type(content) is mmap.mmap:
+                            content.close()
+
+                        # Update progress
+                        if emit_progress:
+                            progress_emit(i + 1, total_files)
+                            last_emit_i = i
+                            last_emit_time = now
+
+                    # The reader stops early when cancelled while waiting on a slow batch
                     if self.cancelled:
                         self.processing_complete.emit(False, "Operation cancelled")
                         return
 
-                    rel_path = os.path.relpath(file_path, self.root_folder)
-                    self.current_file.emit(f"Writing: {rel_path}")
-
-                    # Add separator and file info
-                    if self.separator_style == "Simple":
-                        separator = f"\n\n{'=' * 80}\n"
-                        header = f"FILE: {rel_path}\n{'=' * 80}\n\n"
-                        footer = ""
-                    elif self.separator_style == "Detailed":
-                        try:
-                            file_size = os.path.getsize(file_path)
-                            file_time = os.path.getmtime(file_path)
-                            timestamp = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            file_size = 0
-                            timestamp = "Unknown"
-
-                        separator = f"\n\n{'=' * 80}\n"
-                        header = f"FILE: {rel_path}\n"
-                        header += f"SIZE: {file_size} bytes\n"
-                        header += f"MODIFIED: {timestamp}\n"
-                        header += f"{'=' * 80}\n\n"
-                        footer = ""
-                    else:  # Markdown
-                        separator = f"\n\n"
-                        ext = os.path.splitext(file_path)[1][1:] or "text"
-                        header = f"## {rel_path}\n\n```{ext}\n"
-                        footer = "\n```\n"
-
-                    output.write(separator)
-                    output.write(header)
-
-                    # Write file content (already read)
-                    content, error = file_contents.get(file_path, (None, "File not found"))
-                    if content is not None:
-                        output.write(content)
-                    else:
-                        output.write(f"\n[Error reading file: {error}]\n")
-                        logger.warning(f"Failed to read file {file_path}: {error}")
-
-                    # Write footer if needed
-                    output.write(footer)
-
-                    # Slight pause to prevent UI freezing on very fast systems
-                    QCoreApplication.processEvents()
-
-                    # Update progress
-                    self.progress.emit(i + 1, total_files)
+                    # Always report the final count, whatever the throttle skipped
+                    progress_emit(total_files, total_files)
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
 
             self.processing_complete.emit(True,
                                           f"Successfully processed {total_files} files. Output saved to {self.output_file}")
@@ -1355,6 +1971,10 @@ class FileProcessorWorker(QObject):
         self.cancelled = True
 
 
+# Number of folders remembered in the File > Recent Projects menu
+MAX_RECENT_PROJECTS = 10
+
+
 # Custom dialog for showing preferences
 class PreferencesDialog(QDialog):
     def __init__(self, parent=None, settings=None):
@@ -1380,6 +2000,13 @@ class PreferencesDialog(QDialog):
         self.font_size_spin.setValue(10)
         appearance_layout.addRow("Code Font Size:", self.font_size_spin)
 
+        # Syntax highlighting size limit for the preview
+        self.highlight_limit_spin = QSpinBox()
+        self.highlight_limit_spin.setRange(0, 100 * 1024)
+        self.highlight_limit_spin.setSuffix(" KB")
+        self.highlight_limit_spin.setValue(DEFAULT_HIGHLIGHT_LIMIT_KB)
+        appearance_layout.addRow("Highlight Files Up To:", self.highlight_limit_spin)
+
         layout.addWidget(appearance_group)
 
         # File processing group
@@ -1438,6 +2065,10 @@ class PreferencesDialog(QDialog):
         font_size = self.settings.value("code_font_size", 10, type=int)
         self.font_size_spin.setValue(font_size)
 
+        # Load highlight limit
+        highlight_limit = self.settings.value("highlight_limit_kb", DEFAULT_HIGHLIGHT_LIMIT_KB, type=int)
+        self.highlight_limit_spin.setValue(highlight_limit)
+
         # Load default format
         format = self.settings.value("default_format", "Markdown")
         index = self.default_format_combo.findText(format)
@@ -1445,7 +2076,7 @@ class PreferencesDialog(QDialog):
             self.default_format_combo.setCurrentIndex(index)
 
         # Load exclude patterns
-        patterns = self.settings.value("exclude_patterns", "*.pyc, __pycache__, .git, .vscode, .idea")
+        patterns = self.settings.value("exclude_patterns", DEFAULT_EXCLUDE_PATTERNS)
         self.exclude_patterns_edit.setText(patterns)
 
         # Load concurrency
@@ -1466,6 +2097,9 @@ class PreferencesDialog(QDialog):
         # Save font size
         self.settings.setValue("code_font_size", self.font_size_spin.value())
 
+        # Save highlight limit
+        self.settings.setValue("highlight_limit_kb", self.highlight_limit_spin.value())
+
         # Save default format
         self.settings.setValue("default_format", self.default_format_combo.currentText())
 
@@ -1483,101 +2117,146 @@ class PreferencesDialog(QDialog):
         super().accept()
 
 
-# Worker thread for scanning folders
-class ScanFolderWorker(QObject):
-    progress_signal = pyqtSignal(str, int)  # current file, folder depth
-    file_found_signal = pyqtSignal(str, str, int)  # path, type, size
-    scan_complete = pyqtSignal(dict, dict)  # file tree data, file counts
-
-    def __init__(self, root_folder):
-        super().__init__()
-        self.root_folder = root_folder
-        self.cancelled = False
-
-    def scan_folder(self):
-        try:
-            # Initialize counters
-            file_counts = {"text": 0, "binary": 0, "error": 0}
-
-            # Build file tree recursively
-            tree_data = {}
-            self._scan_directory(self.root_folder, tree_data, file_counts)
-
-            # Emit completion signal with tree data and counts
-            self.scan_complete.emit(tree_data, file_counts)
-
-        except Exception as e:
-            # Handle any exceptions
-            print(f"Error scanning folder: {str(e)}")
-            self.scan_complete.emit({}, {"text": 0, "binary": 0, "error": 1})
-
-    def _scan_directory(self, directory, parent_data, file_counts):
-        path = Path(directory)
-        items = list(path.iterdir())
+class FolderListSignals(QObject):
+    folder_listed = pyqtSignal(int, str, object)  # request id, folder, entries (None on error)
 
-        # Get the number of subdirectories (for progress estimation)
-        subdir_count = sum(1 for item in items if item.is_dir())
 
-        # Sort items: directories first, then files alphabetically
-        items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+class FolderListTask(QRunnable):
+    """Pool task listing one folder so the GUI thread never blocks on the filesystem."""
 
-        for item in items:
-            if self.cancelled:
-                return
-
-            try:
-                item_name = item.name
+    def __init__(self, request_id, folder_path):
+        super().__init__()
+        self.request_id = request_id
+        self.folder_path = folder_path
+        self.signals = FolderListSignals()
 
-                # Emit progress update
-                self.progress_signal.emit(str(item), subdir_count)
+    def run(self):
+        try:
+            with os.scandir(self.folder_path) as it:
+                entries = list(it)
+            # DirEntry caches its stat result, so the sizes shown in the tree are read here
+            for entry in entries:
+                try:
+                    if not entry.is_dir():
+                        entry.stat()
+                except OSError:
+                    pass
+        except OSError as e:
+            # Let the GUI thread list the folder again and report the error itself
+            logger.error(f"Error listing folder {self.folder_path}: {e}")
+            entries = None
+        self.signals.folder_listed.emit(self.request_id, self.folder_path, entries)
 
-                if item.is_dir():
-                    # Create directory entry in parent data
-                    parent_data[item_name] = {
-                        "is_dir": True,
-                        "children": {}
-                    }
 
-                    # Recursively scan subdirectory
-                    self._scan_directory(item, parent_data[item_name]["children"], file_counts)
+class PreviewReadSignals(QObject):
+    preview_read = pyqtSignal(int, str, object, bool, str)  # request id, path, content, more, error
 
-                else:
-                    # Process file
-                    file_size = item.stat().st_size
 
-                    # Determine if it's a text file
-                    file_path = str(item)
-                    is_text = is_text_file(file_path)
-                    file_type = "text" if is_text else "binary"
+class PreviewReadTask(QRunnable):
+    """Pool task reading the head of a file for the preview tab."""
 
-                    # Update counters
-                    if is_text:
-                        file_counts["text"] += 1
-                    else:
-                        file_counts["binary"] += 1
+    def __init__(self, request_id, file_path):
+        super().__init__()
+        self.request_id = request_id
+        self.file_path = file_path
+        self.signals = PreviewReadSignals()
 
-                    # Emit file found signal
-                    self.file_found_signal.emit(file_path, file_type, file_size)
+    def run(self):
+        content, more, error = None, False, ""
+        try:
+            content, more = read_preview_text(self.file_path)
+        except Exception as e:
+            error = str(e)
+        self.signals.preview_read.emit(self.request_id, self.file_path, content, more, error)
 
-                    # Add to parent data
-                    parent_data[item_name] = {
-                        "is_dir": False,
-                        "type": file_type,
-                        "size": file_size
-                    }
 
-            except Exception as e:
-                # Handle any errors with individual files
-                file_counts["error"] += 1
-                parent_data[item.name] = {
-                    "is_dir": False,
-                    "type": "error",
-                    "error": str(e),
-                    "size": 0
-                }
+class ExcludedPathSet:
+    """Set of excluded file paths, indexed by folder so a whole subtree can be dropped."""
 
-    def cancel(self):
-        self.cancelled = True
+    def __init__(self):
+        # Wraps a set rather than subclassing it, so no set mutator can bypass the index
+        self._paths = set()
+        self._by_dir = defaultdict(set)
+
+    def __contains__(self, path):
+        return path in self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def add(self, path):
+        self._paths.add(path)
+        self._by_dir[os.path.dirname(path)].add(path)
+
+    def discard(self, path):
+        if path in self._paths:
+            self._paths.discard(path)
+            folder = os.path.dirname(path)
+            bucket = self._by_dir[folder]
+            bucket.discard(path)
+            if not bucket:
+                del self._by_dir[folder]
+
+    def clear(self):
+        self._paths.clear()
+        self._by_dir.clear()
+
+    def discard_tree(self, folder):
+        """Remove folder and every path under it, visiting folders rather than files."""
+        self.discard(folder)
+        prefix = folder + os.sep
+        for path_dir in [d for d in self._by_dir if d == folder or d.startswith(prefix)]:
+            self._paths.difference_update(self._by_dir.pop(path_dir))
+
+
+# Contents of the Help tab, set when the tab is first shown
+HELP_HTML = """
+<h2>Code Combiner Help</h2>
+<p>This tool helps you combine multiple code files into a single text file for easier analysis or sharing.</p>
+
+<h3>How to Use:</h3>
+<ol>
+    <li><b>Select Project Folder:</b> Click "Browse..." to select the root folder of your project.</li>
+    <li><b>Scan Folder:</b> Click "Scan Folder" to locate all text files in the project.</li>
+    <li><b>Select Files to Include:</b> In the Files tab, check/uncheck files to include/exclude.</li>
+    <li><b>Set Output Location:</b> Specify where the combined file should be saved.</li>
+    <li><b>Choose Separator Style:</b>
+        <ul>
+            <li><b>Simple:</b> Basic separators with file paths</li>
+            <li><b>Detailed:</b> Include file metadata like size and modification date</li>
+            <li><b>Markdown:</b> Format output as a Markdown document with code blocks</li>
+        </ul>
+    </li>
+    <li><b>Combine Files:</b> Click "Combine Files" to generate the output file.</li>
+</ol>
+
+<h3>Tips:</h3>
+<ul>
+    <li>The tool automatically detects text files but you can manually select/deselect files.</li>
+    <li>To exclude an entire folder, uncheck it in the file tree.</li>
+    <li>Preview the content of individual files by clicking on them in the Files tab.</li>
+    <li>Use the filter box to quickly find specific files.</li>
+    <li>Use "Select All" or "Select None" buttons to quickly check/uncheck all files.</li>
+    <li>The "Output Preview" tab shows how your combined file will look.</li>
+    <li>Use "Cancel" to stop a running operation at any time.</li>
+</ul>
+
+<h3>Keyboard Shortcuts:</h3>
+<table>
+    <tr><td><b>Ctrl+O</b></td><td>Select Project Folder</td></tr>
+    <tr><td><b>Ctrl+S</b></td><td>Scan Folder</td></tr>
+    <tr><td><b>Ctrl+R</b></td><td>Combine Files</td></tr>
+    <tr><td><b>Ctrl+F</b></td><td>Focus Filter Box</td></tr>
+    <tr><td><b>Ctrl+A</b></td><td>Select All Files</td></tr>
+    <tr><td><b>Ctrl+N</b></td><td>Select None</td></tr>
+    <tr><td><b>Ctrl+P</b></td><td>Show Preferences</td></tr>
+    <tr><td><b>F1</b></td><td>Show Help</td></tr>
+    <tr><td><b>Esc</b></td><td>Cancel Operation</td></tr>
+</table>
+"""
 
 
 # Main application window
@@ -1589,8 +2268,11 @@ class CodeCombinerApp(QMainWindow):
         self.setWindowTitle("Code Combiner")
         self.setMinimumSize(1000, 700)
 
+        # Standard icons by pixmap; buttons and menu actions share one QIcon each
+        self._icons = {}
+
         # Set application icon
-        app_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogNewFolder)
+        app_icon = self._icon(QStyle.StandardPixmap.SP_FileDialogNewFolder)
         self.setWindowIcon(app_icon)
 
         # Initialize settings object BEFORE UI (UI needs settings object for recent projects)
@@ -1606,15 +2288,27 @@ class CodeCombinerApp(QMainWindow):
         self.worker_thread = None
         self.worker = None
         self.file_list = []
-        self.excluded_paths = set()
+        self.excluded_paths = ExcludedPathSet()
         self.loading_overlay = LoadingOverlay(self.central_widget)
 
+        # Checkbox changes arrive in bursts; the output preview is rebuilt once per burst
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self.update_output_preview)
+
+        # File previews are read on the thread pool; only the latest one is shown
+        self._preview_read_id = 0
+        self._preview_read_task = None
+
+        # Root folder listings run on the thread pool; only the latest one is applied
+        self._root_scan_id = 0
+        self._root_scan_task = None
+        self._root_scan_start = 0.0
+
         # Add loading indicator (initially hidden)
         self.loading_overlay.hide()
 
-        # Apply stylesheet
-        self.setStyleSheet(APP_STYLESHEET)
-
         # Show a welcome message
         QTimer.singleShot(500, self.show_welcome_message)
 
@@ -1648,6 +2342,10 @@ class CodeCombinerApp(QMainWindow):
         font = QFont("Consolas", font_size)
         self.preview_edit.setFont(font)
 
+        # Compile auto-exclude patterns once; they are matched against every name collected
+        self.exclude_match = compile_exclude_patterns(
+            self.settings.value("exclude_patterns", DEFAULT_EXCLUDE_PATTERNS))
+
     def save_settings(self):
         # Save paths
         self.settings.setValue("last_folder", self.input_folder_edit.text())
@@ -1656,6 +2354,10 @@ class CodeCombinerApp(QMainWindow):
         # Save separator style
         self.settings.setValue("separator_style", self.separator_style_combo.currentText())
 
+        # Write out recent projects that are still waiting on the flush timer
+        if self._recent_flush_timer.isActive():
+            self._flush_recent_projects()
+
     def apply_theme(self, theme_name):
         if theme_name == "Dark":
             # ToDo: Implement dark theme stylesheet
@@ -1666,7 +2368,15 @@ class CodeCombinerApp(QMainWindow):
         else:
             # Use default light theme
             QApplication.setStyle(QStyleFactory.create("Fusion"))
-            app.setStyleSheet(APP_STYLESHEET)
+            if app.styleSheet() != APP_STYLESHEET:
+                app.setStyleSheet(APP_STYLESHEET)
+
+    def _icon(self, pixmap):
+        """Return the style's standard icon for pixmap, looked up once."""
+        icon = self._icons.get(pixmap)
+        if icon is None:
+            icon = self._icons[pixmap] = self.style().standardIcon(pixmap)
+        return icon
 
     def init_ui(self):
         # Create central widget
@@ -1717,7 +2427,7 @@ class CodeCombinerApp(QMainWindow):
         self.input_folder_edit.setPlaceholderText("Select the root folder of your project")
 
         browse_input_btn = QPushButton("Browse...")
-        browse_input_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+        browse_input_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogOpenButton))
         browse_input_btn.clicked.connect(self.browse_input_folder)
 
         input_folder_layout = QHBoxLayout()
@@ -1728,7 +2438,7 @@ class CodeCombinerApp(QMainWindow):
 
         # Scan button
         scan_btn = QPushButton("Scan Folder")
-        scan_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView))
+        scan_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_FileDialogContentsView))
         scan_btn.clicked.connect(self.scan_folder)
         input_layout.addWidget(scan_btn)
 
@@ -1744,7 +2454,7 @@ class CodeCombinerApp(QMainWindow):
         self.output_file_edit.setPlaceholderText("Path for the combined output file")
 
         browse_output_btn = QPushButton("Browse...")
-        browse_output_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        browse_output_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogSaveButton))
         browse_output_btn.clicked.connect(self.browse_output_file)
 
         output_file_layout.addWidget(self.output_file_edit)
@@ -1795,14 +2505,14 @@ class CodeCombinerApp(QMainWindow):
 
         # Process button
         self.process_btn = QPushButton("Combine Files")
-        self.process_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.process_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPlay))
         self.process_btn.clicked.connect(self.start_processing)
         self.process_btn.setEnabled(False)
         buttons_layout.addWidget(self.process_btn)
 
         # Cancel button
         self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        self.cancel_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaStop))
         self.cancel_btn.clicked.connect(self.cancel_processing)
         self.cancel_btn.setEnabled(False)
         self.cancel_btn.setStyleSheet("background-color: #ff3b30;")
@@ -1817,13 +2527,13 @@ class CodeCombinerApp(QMainWindow):
 
         # Select All / None buttons
         self.select_all_btn = QPushButton("Select All")
-        self.select_all_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
+        self.select_all_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogApplyButton))
         self.select_all_btn.clicked.connect(self.select_all_files)
         self.select_all_btn.setEnabled(False)
         actions_layout.addWidget(self.select_all_btn)
 
         self.select_none_btn = QPushButton("Select None")
-        self.select_none_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
+        self.select_none_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogCancelButton))
         self.select_none_btn.clicked.connect(self.deselect_all_files)
         self.select_none_btn.setEnabled(False)
         actions_layout.addWidget(self.select_none_btn)
@@ -1839,6 +2549,7 @@ class CodeCombinerApp(QMainWindow):
         # Right panel with tabs
         right_panel = QTabWidget()
         right_panel.setDocumentMode(True)
+        self.right_panel = right_panel  # Kept so tab switches need no findChild search
 
         # File tree tab
         file_tree_tab = QWidget()
@@ -1850,7 +2561,12 @@ class CodeCombinerApp(QMainWindow):
         filter_label = QLabel("Filter:")
         self.filter_edit = QLineEdit()
         self.filter_edit.setPlaceholderText("Filter files by name or extension...")
-        self.filter_edit.textChanged.connect(self.filter_files)
+        # The tree is filtered once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.filter_edit)
 
@@ -1900,6 +2616,7 @@ class CodeCombinerApp(QMainWindow):
 
         # File tree widget
         self.file_tree_widget = FileTreeWidget()
+        self.file_tree_widget.set_main_window(self)
         self.file_tree_widget.fileClicked.connect(self._preview_file)
 
         # Connect to item changed for exclusion list
@@ -1927,10 +2644,10 @@ class CodeCombinerApp(QMainWindow):
         preview_layout.addLayout(preview_toolbar)
 
         # Preview text area
-        self.preview_edit = QTextEdit()
+        self.preview_edit = QPlainTextEdit()
         self.preview_edit.setReadOnly(True)
         self.preview_edit.setFont(QFont("Consolas", 10))
-        self.preview_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.preview_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
 
         # Add syntax highlighter
         self.syntax_highlighter = CodeSyntaxHighlighter(self.preview_edit.document())
@@ -1944,10 +2661,10 @@ class CodeCombinerApp(QMainWindow):
         output_preview_layout.setContentsMargins(5, 5, 5, 5)
 
         # Output preview text area
-        self.output_preview_edit = QTextEdit()
+        self.output_preview_edit = QPlainTextEdit()
         self.output_preview_edit.setReadOnly(True)
         self.output_preview_edit.setFont(QFont("Consolas", 10))
-        self.output_preview_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.output_preview_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.output_preview_edit.setPlaceholderText("Process files to see a preview of the combined output")
 
         output_preview_layout.addWidget(self.output_preview_edit)
@@ -1966,62 +2683,20 @@ class CodeCombinerApp(QMainWindow):
         help_content = QWidget()
         help_content_layout = QVBoxLayout(help_content)
 
+        # The help page is filled in the first time its tab is shown
         help_text = QTextEdit()
         help_text.setReadOnly(True)
         help_text.setFrameShape(QFrame.Shape.NoFrame)
-
-        help_html = """
-        <h2>Code Combiner Help</h2>
-        <p>This tool helps you combine multiple code files into a single text file for easier analysis or sharing.</p>
-
-        <h3>How to Use:</h3>
-        <ol>
-            <li><b>Select Project Folder:</b> Click "Browse..." to select the root folder of your project.</li>
-            <li><b>Scan Folder:</b> Click "Scan Folder" to locate all text files in the project.</li>
-            <li><b>Select Files to Include:</b> In the Files tab, check/uncheck files to include/exclude.</li>
-            <li><b>Set Output Location:</b> Specify where the combined file should be saved.</li>
-            <li><b>Choose Separator Style:</b>
-                <ul>
-                    <li><b>Simple:</b> Basic separators with file paths</li>
-                    <li><b>Detailed:</b> Include file metadata like size and modification date</li>
-                    <li><b>Markdown:</b> Format output as a Markdown document with code blocks</li>
-                </ul>
-            </li>
-            <li><b>Combine Files:</b> Click "Combine Files" to generate the output file.</li>
-        </ol>
-
-        <h3>Tips:</h3>
-        <ul>
-            <li>The tool automatically detects text files but you can manually select/deselect files.</li>
-            <li>To exclude an entire folder, uncheck it in the file tree.</li>
-            <li>Preview the content of individual files by clicking on them in the Files tab.</li>
-            <li>Use the filter box to quickly find specific files.</li>
-            <li>Use "Select All" or "Select None" buttons to quickly check/uncheck all files.</li>
-            <li>The "Output Preview" tab shows how your combined file will look.</li>
-            <li>Use "Cancel" to stop a running operation at any time.</li>
-        </ul>
-
-        <h3>Keyboard Shortcuts:</h3>
-        <table>
-            <tr><td><b>Ctrl+O</b></td><td>Select Project Folder</td></tr>
-            <tr><td><b>Ctrl+S</b></td><td>Scan Folder</td></tr>
-            <tr><td><b>Ctrl+R</b></td><td>Combine Files</td></tr>
-            <tr><td><b>Ctrl+F</b></td><td>Focus Filter Box</td></tr>
-            <tr><td><b>Ctrl+A</b></td><td>Select All Files</td></tr>
-            <tr><td><b>Ctrl+N</b></td><td>Select None</td></tr>
-            <tr><td><b>Ctrl+P</b></td><td>Show Preferences</td></tr>
-            <tr><td><b>F1</b></td><td>Show Help</td></tr>
-            <tr><td><b>Esc</b></td><td>Cancel Operation</td></tr>
-        </table>
-        """
-
-        help_text.setHtml(help_html)
+        help_text.document().setUndoRedoEnabled(False)
+        self._help_text = help_text
+        self._help_loaded = False
         help_content_layout.addWidget(help_text)
 
         help_scroll.setWidget(help_content)
         help_layout.addWidget(help_scroll)
 
-        right_panel.addTab(help_tab, "Help")
+        self._help_tab_index = right_panel.addTab(help_tab, "Help")
+        right_panel.currentChanged.connect(self._on_tab_changed)
 
         # Add panels to splitter
         content_splitter.addWidget(right_panel)
@@ -2052,20 +2727,20 @@ class CodeCombinerApp(QMainWindow):
         # Select Folder action
         open_action = QAction("Select Folder...", self)
         open_action.setShortcut("Ctrl+O")
-        open_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+        open_action.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogOpenButton))
         open_action.triggered.connect(self.browse_input_folder)
         file_menu.addAction(open_action)
 
         # Scan Folder action
         scan_action = QAction("Scan Folder", self)
         scan_action.setShortcut("Ctrl+S")
-        scan_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView))
+        scan_action.setIcon(self._icon(QStyle.StandardPixmap.SP_FileDialogContentsView))
         scan_action.triggered.connect(self.scan_folder)
         file_menu.addAction(scan_action)
 
         # Select Output File action
         output_action = QAction("Select Output File...", self)
-        output_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        output_action.setIcon(self._icon(QStyle.StandardPixmap.SP_DialogSaveButton))
         output_action.triggered.connect(self.browse_output_file)
         file_menu.addAction(output_action)
 
@@ -2074,14 +2749,14 @@ class CodeCombinerApp(QMainWindow):
         # Combine Files action
         combine_action = QAction("Combine Files", self)
         combine_action.setShortcut("Ctrl+R")
-        combine_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        combine_action.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPlay))
         combine_action.triggered.connect(self.start_processing)
         file_menu.addAction(combine_action)
 
         # Cancel action
         cancel_action = QAction("Cancel", self)
         cancel_action.setShortcut("Esc")
-        cancel_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        cancel_action.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaStop))
         cancel_action.triggered.connect(self.cancel_processing)
         file_menu.addAction(cancel_action)
 
@@ -2089,6 +2764,7 @@ class CodeCombinerApp(QMainWindow):
 
         # Recent files submenu
         self.recent_menu = file_menu.addMenu("Recent Projects")
+        self._init_recent_menu()
         self.update_recent_menu()
 
         file_menu.addSeparator()
@@ -2136,25 +2812,25 @@ class CodeCombinerApp(QMainWindow):
         # Files tab action
         files_action = QAction("Files Panel", self)
         files_action.setShortcut("F2")
-        files_action.triggered.connect(lambda: self.central_widget.findChild(QTabWidget).setCurrentIndex(0))
+        files_action.triggered.connect(partial(self._set_tab, 0))
         view_menu.addAction(files_action)
 
         # Preview tab action
         preview_action = QAction("Preview Panel", self)
         preview_action.setShortcut("F3")
-        preview_action.triggered.connect(lambda: self.central_widget.findChild(QTabWidget).setCurrentIndex(1))
+        preview_action.triggered.connect(partial(self._set_tab, 1))
         view_menu.addAction(preview_action)
 
         # Output Preview tab action
         output_action = QAction("Output Preview", self)
         output_action.setShortcut("F4")
-        output_action.triggered.connect(lambda: self.central_widget.findChild(QTabWidget).setCurrentIndex(2))
+        output_action.triggered.connect(partial(self._set_tab, 2))
         view_menu.addAction(output_action)
 
         # Help tab action
         help_action = QAction("Help", self)
         help_action.setShortcut("F1")
-        help_action.triggered.connect(lambda: self.central_widget.findChild(QTabWidget).setCurrentIndex(3))
+        help_action.triggered.connect(partial(self._set_tab, 3))
         view_menu.addAction(help_action)
 
         # Help menu
@@ -2162,7 +2838,7 @@ class CodeCombinerApp(QMainWindow):
 
         # Quick Help action
         quick_help_action = QAction("Quick Help", self)
-        quick_help_action.triggered.connect(lambda: self.central_widget.findChild(QTabWidget).setCurrentIndex(3))
+        quick_help_action.triggered.connect(partial(self._set_tab, 3))
         help_menu.addAction(quick_help_action)
 
         # About action
@@ -2185,37 +2861,83 @@ class CodeCombinerApp(QMainWindow):
         prev_tab_shortcut = QShortcut(QKeySequence("Ctrl+Shift+Tab"), self)
         prev_tab_shortcut.activated.connect(self.prev_tab)
 
+    def _on_tab_changed(self, index):
+        """Load the help page the first time the Help tab is shown."""
+        if index == self._help_tab_index and not self._help_loaded:
+            self._help_text.setHtml(HELP_HTML)
+            self._help_loaded = True
+
+    def _set_tab(self, index, checked=False):
+        """Show the right panel tab at index. The checked parameter is from the signal and is ignored."""
+        self.right_panel.setCurrentIndex(index)
+
     def next_tab(self):
-        tabwidget = self.central_widget.findChild(QTabWidget)
+        tabwidget = self.right_panel
         current = tabwidget.currentIndex()
         tabwidget.setCurrentIndex((current + 1) % tabwidget.count())
 
     def prev_tab(self):
-        tabwidget = self.central_widget.findChild(QTabWidget)
+        tabwidget = self.right_panel
         current = tabwidget.currentIndex()
         tabwidget.setCurrentIndex((current - 1) % tabwidget.count())
 
-    def update_recent_menu(self):
-        self.recent_menu.clear()
+    def _init_recent_menu(self):
+        """Build the recent projects menu once; update_recent_menu only re-texts it."""
+        self._recent_projects_shown = None
 
-        # Get recent projects from settings
+        # Recent projects are kept in memory and written back to settings shortly
+        # after they change rather than on every update
         recent_projects = self.settings.value("recent_projects", [])
-        if not recent_projects:
-            no_recent = QAction("No Recent Projects", self)
-            no_recent.setEnabled(False)
-            self.recent_menu.addAction(no_recent)
+        if not isinstance(recent_projects, list):
+            recent_projects = [recent_projects] if recent_projects else []
+        self._recent_projects = recent_projects[:MAX_RECENT_PROJECTS]
+        self._recent_flush_timer = QTimer(self)
+        self._recent_flush_timer.setSingleShot(True)
+        self._recent_flush_timer.setInterval(1000)
+        self._recent_flush_timer.timeout.connect(self._flush_recent_projects)
+
+        self._no_recent_action = QAction("No Recent Projects", self)
+        self._no_recent_action.setEnabled(False)
+        self.recent_menu.addAction(self._no_recent_action)
+
+        # One action per slot, each opening whatever path it currently holds
+        self._recent_actions = []
+        for _ in range(MAX_RECENT_PROJECTS):
+            action = QAction(self)
+            action.triggered.connect(partial(self._open_recent_action, action))
+            self.recent_menu.addAction(action)
+            self._recent_actions.append(action)
+
+        self._recent_separator = self.recent_menu.addSeparator()
+
+        self._clear_recent_action = QAction("Clear Recent Projects", self)
+        self._clear_recent_action.triggered.connect(self.clear_recent_projects)
+        self.recent_menu.addAction(self._clear_recent_action)
+
+    def update_recent_menu(self):
+        recent_projects = tuple(self._recent_projects)
+
+        # Nothing to do if the list is unchanged since the last update
+        if recent_projects == self._recent_projects_shown:
             return
+        self._recent_projects_shown = recent_projects
 
-        for project in recent_projects:
-            action = QAction(project, self)
-            action.triggered.connect(lambda checked, p=project: self.open_recent_project(p))
-            self.recent_menu.addAction(action)
+        for i, action in enumerate(self._recent_actions):
+            if i < len(recent_projects):
+                action.setText(recent_projects[i])
+                action.setData(recent_projects[i])
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
 
-        self.recent_menu.addSeparator()
+        has_recent = bool(recent_projects)
+        self._no_recent_action.setVisible(not has_recent)
+        self._recent_separator.setVisible(has_recent)
+        self._clear_recent_action.setVisible(has_recent)
 
-        clear_action = QAction("Clear Recent Projects", self)
-        clear_action.triggered.connect(self.clear_recent_projects)
-        self.recent_menu.addAction(clear_action)
+    def _open_recent_action(self, action, checked=False):
+        """Open the project held by a recent projects menu action."""
+        self.open_recent_project(action.data())
 
     def open_recent_project(self, project_path):
         if os.path.isdir(project_path):
@@ -2224,16 +2946,13 @@ class CodeCombinerApp(QMainWindow):
         else:
             # Remove invalid path from recent projects
             self.status_bar.showTemporaryMessage(f"Project folder not found: {project_path}")
-            recent_projects = self.settings.value("recent_projects", [])
-            if project_path in recent_projects:
-                recent_projects.remove(project_path)
-                self.settings.setValue("recent_projects", recent_projects)
+            if project_path in self._recent_projects:
+                self._recent_projects.remove(project_path)
+                self._recent_flush_timer.start()
                 self.update_recent_menu()
 
     def add_to_recent_projects(self, project_path):
-        recent_projects = self.settings.value("recent_projects", [])
-        if not isinstance(recent_projects, list):
-            recent_projects = []
+        recent_projects = self._recent_projects
 
         # Remove if exists (to move to top)
         if project_path in recent_projects:
@@ -2242,20 +2961,27 @@ class CodeCombinerApp(QMainWindow):
         # Add to top of list
         recent_projects.insert(0, project_path)
 
-        # Limit to 10 recent projects
-        recent_projects = recent_projects[:10]
+        # Limit the number of recent projects
+        del recent_projects[MAX_RECENT_PROJECTS:]
 
-        # Save to settings
-        self.settings.setValue("recent_projects", recent_projects)
+        # Save to settings once the burst of changes is over
+        self._recent_flush_timer.start()
 
         # Update menu
         self.update_recent_menu()
 
     def clear_recent_projects(self, checked=False):
         """Clear recent projects list. The checked parameter is from the signal and is ignored."""
-        self.settings.setValue("recent_projects", [])
+        self._recent_projects.clear()
+        self._recent_flush_timer.start()
         self.update_recent_menu()
 
+    def _flush_recent_projects(self):
+        """Write the in-memory recent projects list back to settings."""
+        self._recent_flush_timer.stop()
+        self.settings.setValue("recent_projects", self._recent_projects)
+        self.settings.sync()
+
     def show_preferences(self, checked=False):
         """Show preferences dialog. The checked parameter is from the signal and is ignored."""
         dialog = PreferencesDialog(self, self.settings)
@@ -2269,6 +2995,9 @@ class CodeCombinerApp(QMainWindow):
             self.preview_edit.setFont(font)
             self.output_preview_edit.setFont(font)
 
+            self.exclude_match = compile_exclude_patterns(
+                self.settings.value("exclude_patterns", DEFAULT_EXCLUDE_PATTERNS))
+
             # Update separator style combo if default changed
             default_format = self.settings.value("default_format", "Markdown")
             if not self.file_list:  # Only change if no files loaded
@@ -2336,9 +3065,12 @@ class CodeCombinerApp(QMainWindow):
         perf_logger.info(f"Scanning folder: {input_folder}")
         scan_start = time.perf_counter()
 
-        # Clear previous scan results
-        self.file_list = []
-        self.excluded_paths = set()
+        # Clear previous scan results; the selection state is reset once the new root
+        # arrives, and the old tree is locked until then so no clicks land in between
+        self.file_tree_widget.setEnabled(False)
+        self.process_btn.setEnabled(False)
+        self.select_all_btn.setEnabled(False)
+        self.select_none_btn.setEnabled(False)
         self.preview_edit.clear()
         self.output_preview_edit.clear()
         self.preview_file_label.setText("No file selected")
@@ -2347,9 +3079,29 @@ class CodeCombinerApp(QMainWindow):
         self.progress_bar.setValue(0)
         self.current_file_label.setText("Loading root folder...")
         self.status_bar.showMessage("Loading folder...")
+        self.loading_overlay.show_loading("Scanning...")
+
+        # List the root folder on the thread pool; a newer scan supersedes this one
+        self._root_scan_id += 1
+        task = FolderListTask(self._root_scan_id, input_folder)
+        task.signals.folder_listed.connect(self._on_root_scanned)
+        self._root_scan_task = task
+        self._root_scan_start = scan_start
+        QThreadPool.globalInstance().start(task)
+
+    def _on_root_scanned(self, scan_id, input_folder, entries):
+        """Finish scan_folder with the root listing made by FolderListTask."""
+        if scan_id != self._root_scan_id:
+            return
+        self._root_scan_task = None
+        self.loading_overlay.hide_loading()
+
+        self.file_list = []
+        self.excluded_paths = ExcludedPathSet()
 
         # Use lazy loading - just set root and load immediate contents
-        self.file_tree_widget.set_root_folder(input_folder)
+        self.file_tree_widget.set_root_folder(input_folder, entries)
+        self.file_tree_widget.setEnabled(True)
 
         # Collect extensions from root level (will collect more as user expands)
         self.collect_and_display_extensions()
@@ -2360,7 +3112,7 @@ class CodeCombinerApp(QMainWindow):
         self.select_none_btn.setEnabled(True)
 
         # Update status
-        scan_elapsed = time.perf_counter() - scan_start
+        scan_elapsed = time.perf_counter() - self._root_scan_start
         perf_logger.info(f"Folder scan completed in {scan_elapsed:.4f}s")
         logger.info(f"Folder loaded successfully in {scan_elapsed:.4f}s")
 
@@ -2374,13 +3126,24 @@ class CodeCombinerApp(QMainWindow):
         logger.info(f"Toggling reverse ignore mode to: {is_reverse}")
         self.file_tree_widget.reverse_ignore_mode = is_reverse
 
-        # Update all existing items' check states
-        root = self.file_tree_widget.invisibleRootItem()
+        # Update all existing items' check states with painting and signals suspended,
+        # so the tree invalidates and redraws once instead of once per item
+        tree = self.file_tree_widget
+        root = tree.invisibleRootItem()
         if root.childCount() > 0:
-            self._update_tree_check_states(root.child(0), is_reverse)
+            tree.setUpdatesEnabled(False)
+            tree.blockSignals(True)
+            try:
+                self._update_tree_check_states(root.child(0), is_reverse)
+            finally:
+                tree.blockSignals(False)
+                tree.setUpdatesEnabled(True)
 
     def _update_tree_check_states(self, item, is_reverse):
-        """Recursively update check states when toggling modes."""
+        """Update check states of an item and its loaded descendants when toggling modes.
+
+        The caller suspends the tree's signals and painting around the bulk update.
+        """
         if item is None:
             return
 
@@ -2388,50 +3151,25 @@ class CodeCombinerApp(QMainWindow):
         # - Normal mode: unchecked = included (user checks to exclude)
         # - Reverse mode: unchecked = excluded (user checks to include)
         # Both modes start with everything unchecked, user builds their selection
-
-        # Block signals to prevent cascade during bulk update
-        tree = item.treeWidget()
-        if tree:
-            tree.blockSignals(True)
-
         new_state = Qt.CheckState.Unchecked
-        item.setCheckState(0, new_state)
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            item.setCheckState(0, new_state)
 
-        logger.debug(f"Reset {item.text(0)} to unchecked")
+            logger.debug(f"Reset {item.text(0)} to unchecked")
 
-        # Recursively update children
-        for i in range(item.childCount()):
-            child = item.child(i)
-            # Skip "Loading..." placeholder
-            if child.text(0) != "Loading...":
-                self._update_tree_check_states(child, is_reverse)
-
-        # Unblock signals
-        if tree:
-            tree.blockSignals(False)
+            # Queue children in reverse so they are visited in tree order
+            for i in range(item.childCount() - 1, -1, -1):
+                child = item.child(i)
+                # Skip "Loading..." placeholder
+                if child.text(0) != LOADING_PLACEHOLDER:
+                    stack.append(child)
 
     def collect_and_display_extensions(self):
         """Collect file extensions from currently loaded tree items and display as checkboxes."""
-        extensions = set()
-
-        # Collect extensions from tree
-        def collect_from_item(item):
-            if item.text(1) in ["text", "binary"]:  # It's a file
-                filename = item.text(0)
-                ext = os.path.splitext(filename)[1].lower()
-                if ext:
-                    extensions.add(ext)
-
-            # Recursively collect from children (only loaded folders)
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if child.text(0) != "Loading...":
-                    collect_from_item(child)
-
-        # Start from root
-        root = self.file_tree_widget.invisibleRootItem()
-        if root.childCount() > 0:
-            collect_from_item(root.child(0))
+        # The tree keeps a count per extension as items are loaded
+        extensions = {ext for ext, count in self.file_tree_widget.extension_counts.items() if ext and count}
 
         # Update UI with checkboxes for each extension
         self._update_extension_checkboxes(extensions)
@@ -2468,42 +3206,13 @@ class CodeCombinerApp(QMainWindow):
             # Ignore this extension
             self.file_tree_widget.ignored_extensions.add(extension)
 
-        # Refresh the tree to apply filters (only refresh loaded folders)
-        self._refresh_loaded_folders()
-
-    def _refresh_loaded_folders(self):
-        """Refresh all loaded folders in the tree to apply extension filters."""
-        # Get all loaded directories
-        for dir_path in list(self.file_tree_widget.loaded_directories):
-            # Find the tree item for this directory
-            item = self._find_item_by_path(dir_path)
-            if item is not None:
-                # Clear children and reload
-                item.takeChildren()
-                self.file_tree_widget.load_folder_contents(item, dir_path)
-
-        # Update extension list again (some may have been filtered out)
-        self.collect_and_display_extensions()
+        # Hide or show the loaded files of this extension in place
+        self.file_tree_widget.set_extension_hidden(
+            extension, extension in self.file_tree_widget.ignored_extensions)
 
     def _find_item_by_path(self, path):
         """Find a tree item by its filesystem path."""
-        def search_item(item, target_path):
-            item_path = self.file_tree_widget.get_item_path(item)
-            if item_path == target_path:
-                return item
-
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if child.text(0) != "Loading...":
-                    result = search_item(child, target_path)
-                    if result is not None:
-                        return result
-            return None
-
-        root = self.file_tree_widget.invisibleRootItem()
-        if root.childCount() > 0:
-            return search_item(root.child(0), path)
-        return None
+        return self.file_tree_widget.find_item(path)
 
     @log_performance
     def get_checked_files_from_tree(self):
@@ -2517,45 +3226,35 @@ class CodeCombinerApp(QMainWindow):
         # Build set of excluded folders from tree (user explicitly checked to exclude)
         excluded_folders = set()
 
-        def collect_exclusions(item):
-            """First pass: collect folders that user explicitly excluded."""
-            if item.text(0) == "Loading...":
-                return
-
-            item_path = self.file_tree_widget.get_item_path(item)
-            is_checked = item.checkState(0) == Qt.CheckState.Checked
-            item_type = item.text(1)
-
-            if item_type == "folder":
-                # Normal mode: checked = excluded
-                # Reverse mode: unchecked = excluded
-                is_excluded = is_checked if not reverse_mode else not is_checked
-
-                if is_excluded:
-                    # Normalize path for consistent comparison
-                    normalized_path = os.path.normcase(os.path.normpath(item_path))
-                    excluded_folders.add(normalized_path)
-                    logger.debug(f"Folder marked for exclusion: {normalized_path}")
-
-                # Check children (even if this folder is excluded, we want to know about nested exclusions)
-                for i in range(item.childCount()):
-                    collect_exclusions(item.child(i))
-
-        # First, collect all explicit exclusions from loaded tree
+        # First pass: collect folders the user explicitly excluded from the loaded tree
+        get_item_path = self.file_tree_widget.get_item_path
+        checked = Qt.CheckState.Checked
         root = self.file_tree_widget.invisibleRootItem()
-        if root.childCount() > 0:
-            collect_exclusions(root.child(0))
+        stack = [root.child(0)] if root.childCount() > 0 else []
+        while stack:
+            item = stack.pop()
+            # Only folders can exclude; files and "Loading..." placeholders are skipped
+            if item.text(1) != ITEM_TYPE_FOLDER or item.text(0) == LOADING_PLACEHOLDER:
+                continue
+
+            # Normal mode: checked = excluded
+            # Reverse mode: unchecked = excluded
+            is_checked = item.checkState(0) == checked
+            is_excluded = is_checked if not reverse_mode else not is_checked
+
+            if is_excluded:
+                # Normalize path for consistent comparison
+                normalized_path = os.path.normcase(os.path.normpath(get_item_path(item)))
+                excluded_folders.add(normalized_path)
+                logger.debug(f"Folder marked for exclusion: {normalized_path}")
+
+            # Check children (even if this folder is excluded, we want to know about nested exclusions)
+            for i in range(item.childCount()):
+                stack.append(item.child(i))
 
         # Now scan filesystem, respecting exclusions
         logger.info(f"Excluded folders: {excluded_folders}")
 
-        def should_exclude_path(path):
-            """Check if a path should be excluded based on folder exclusions."""
-            for excluded in excluded_folders:
-                if path == excluded or path.startswith(excluded + os.sep):
-                    return True
-            return False
-
         # Check if root folder should be scanned
         root = self.file_tree_widget.invisibleRootItem()
         if root.childCount() > 0:
@@ -2578,156 +3277,98 @@ class CodeCombinerApp(QMainWindow):
         return checked_files
 
     def _collect_files_from_folder_with_exclusions(self, folder_path, file_list, excluded_folders):
-        """Recursively collect all text files from a folder, respecting exclusions."""
-        try:
-            path = Path(folder_path)
-            if not path.exists() or not path.is_dir():
-                return
+        """Collect all text files under a folder, respecting exclusions."""
+        self._collect_text_files(folder_path, file_list, excluded_folders, self.exclude_match)
 
-            # Check if this folder is excluded (normalize for comparison)
-            folder_path_normalized = os.path.normcase(os.path.normpath(str(path)))
+    def _collect_text_files(self, folder_path, file_list, excluded_folders, exclude_match):
+        """Append the text files under folder_path to file_list, in directory-walk order.
 
+        Uses os.scandir so each entry's type comes from the directory listing, and an
+        explicit stack of per-folder iterators instead of recursion. Excluded folders
+        are pruned without being listed. Files whose extension does not decide their
+        type are sniffed afterwards on a thread pool.
+        """
+        def is_excluded(dir_path):
+            # Check if this folder is excluded (normalize for comparison)
+            normalized = os.path.normcase(os.path.normpath(dir_path))
             for excluded in excluded_folders:
                 # Check exact match or if this folder is a subfolder of an excluded folder
                 # Need to ensure excluded path ends with separator when checking subfolders
-                excluded_with_sep = excluded + os.sep
-                if folder_path_normalized == excluded:
-                    logger.info(f"EXCLUDING folder (exact match): {folder_path_normalized}")
-                    return
-                elif folder_path_normalized.startswith(excluded_with_sep):
-                    logger.info(f"EXCLUDING folder (subfolder of {excluded}): {folder_path_normalized}")
-                    return
-
-            for item_path in path.iterdir():
-                try:
-                    if item_path.is_dir():
-                        # Recurse into subdirectory
-                        self._collect_files_from_folder_with_exclusions(str(item_path), file_list, excluded_folders)
-                    else:
-                        # Check if it's a text file
-                        extension = item_path.suffix.lower()
-                        if extension not in self.file_tree_widget.ignored_extensions:
-                            if is_text_file(str(item_path)):
-                                logger.debug(f"Adding file: {str(item_path)}")
-                                file_list.append(str(item_path))
-                except Exception as e:
-                    logger.error(f"Error collecting file {item_path}: {e}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"Error collecting from folder {folder_path}: {e}")
+                if normalized == excluded:
+                    logger.info(f"EXCLUDING folder (exact match): {normalized}")
+                    return True
+                if normalized.startswith(excluded + os.sep):
+                    logger.info(f"EXCLUDING folder (subfolder of {excluded}): {normalized}")
+                    return True
+            return False
 
-    def _collect_files_from_folder(self, folder_path, file_list):
-        """Recursively collect all text files from a folder (even if not loaded in tree)."""
-        try:
-            path = Path(folder_path)
-            if not path.exists() or not path.is_dir():
-                return
+        def list_folder(dir_path):
+            try:
+                with os.scandir(dir_path) as it:
+                    return iter(list(it))
+            except OSError as e:
+                logger.error(f"Error collecting from folder {dir_path}: {e}")
+                return None
+
+        root = str(Path(folder_path))
+        if not os.path.isdir(root) or is_excluded(root):
+            return
 
-            for item_path in path.iterdir():
-                try:
-                    if item_path.is_dir():
-                        # Recurse into subdirectory
-                        self._collect_files_from_folder(str(item_path), file_list)
-                    else:
-                        # Check if it's a text file
-                        extension = item_path.suffix.lower()
-                        if extension not in self.file_tree_widget.ignored_extensions:
-                            if is_text_file(str(item_path)):
-                                file_list.append(str(item_path))
-                except Exception as e:
-                    print(f"Error collecting file {item_path}: {e}")
+        # The walk never enters an excluded folder, so below the root an exact
+        # lookup is enough; ignored and binary extensions share one lookup too
+        excluded_set = frozenset(excluded_folders)
+        skipped_extensions = frozenset(self.file_tree_widget.ignored_extensions) | BINARY_EXTENSIONS
+        normcase = os.path.normcase
+        normpath = os.path.normpath
+        splitext = os.path.splitext
+        # (path, is_text) in walk order; is_text is None until the file is sniffed
+        candidates = []
+        to_sniff = []
+
+        entries = list_folder(root)
+        stack = [entries] if entries is not None else []
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            try:
+                # Skip names matching the auto-exclude patterns, files and folders alike
+                if exclude_match is not None and exclude_match(entry.name):
                     continue
-
-        except Exception as e:
-            print(f"Error collecting from folder {folder_path}: {e}")
-
-    def update_scan_progress(self, current_file, count):
-        self.current_file_label.setText(f"Scanning: {current_file}")
-
-        # If count is available, update progress as percentage
-        if count > 0:
-            self.progress_bar.setMaximum(100)
-            progress_value = min(99, int((current_file.count(os.sep) / count) * 100))
-            self.progress_bar.setValue(progress_value)
-
-    def add_file_to_tree(self, file_path, file_type, file_size):
-        # Called by scan worker for each file found
-        if file_type == "text":
-            self.file_list.append(file_path)
-
-    def scan_complete(self, file_tree_data, file_counts):
-        # Clean up the thread
-        self.scan_thread.quit()
-        self.scan_thread.wait()
-
-        # Build the tree from the data
-        self.build_file_tree(file_tree_data)
-
-        # Update UI
-        self.process_btn.setEnabled(True)
-        self.select_all_btn.setEnabled(True)
-        self.select_none_btn.setEnabled(True)
-
-        text_count = file_counts["text"]
-        binary_count = file_counts["binary"]
-        total_count = text_count + binary_count
-
-        self.status_bar.showMessage(f"Found {text_count} text files and {binary_count} binary files")
-        self.current_file_label.setText(f"Ready - {text_count} text files available for processing")
-        self.progress_bar.setValue(100)
-
-        # Hide loading overlay
-        self.loading_overlay.hide_loading()
-
-        # Generate an example output preview
-        self.update_output_preview()
-
-    def build_file_tree(self, file_tree_data):
-        # Root item
-        root_name = os.path.basename(self.input_folder_edit.text())
-        root_item = QTreeWidgetItem(self.file_tree_widget, [root_name, "folder", ""])
-        root_item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-        root_item.setFlags(root_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        root_item.setCheckState(0, Qt.CheckState.Checked)
-
-        # Recursively build tree
-        self._build_tree_items(root_item, file_tree_data)
-
-        # Expand root
-        self.file_tree_widget.expandItem(root_item)
-
-    def _build_tree_items(self, parent_item, items_data):
-        # Sort items: folders first, then files
-        sorted_items = sorted(items_data.items(), key=lambda x: (not x[1].get("is_dir", False), x[0].lower()))
-
-        for name, data in sorted_items:
-            if data.get("is_dir", False):
-                # Create folder item
-                folder_item = QTreeWidgetItem(parent_item, [name, "folder", ""])
-                folder_item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-                folder_item.setFlags(folder_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                folder_item.setCheckState(0, Qt.CheckState.Checked)
-
-                # Recursively build children
-                self._build_tree_items(folder_item, data.get("children", {}))
-            else:
-                # Create file item
-                file_type = data.get("type", "unknown")
-                size_str = self.format_size(data.get("size", 0))
-
-                file_item = QTreeWidgetItem(parent_item, [name, file_type, size_str])
-
-                # Set icon based on file type
-                if file_type == "text":
-                    file_item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
+                if entry.is_dir():
+                    # Descend into the subdirectory before the rest of this folder
+                    normalized = normcase(normpath(entry.path))
+                    if normalized in excluded_set:
+                        logger.info(f"EXCLUDING folder (exact match): {normalized}")
+                    else:
+                        entries = list_folder(entry.path)
+                        if entries is not None:
+                            stack.append(entries)
                 else:
-                    file_item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_FileLinkIcon))
+                    # Check if it's a text file; known extensions decide without a read
+                    extension = splitext(entry.name)[1].lower()
+                    if extension in skipped_extensions:
+                        continue
+                    if extension in TEXT_EXTENSIONS:
+                        candidates.append((entry.path, True))
+                    else:
+                        candidates.append((entry.path, None))
+                        to_sniff.append(entry.path)
+            except Exception as e:
+                logger.error(f"Error collecting file {entry.path}: {e}")
 
-                # Make text files checkable
-                if file_type == "text":
-                    file_item.setFlags(file_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                    file_item.setCheckState(0, Qt.CheckState.Checked)
+        # Sniffing is open/read latency, so overlap it across threads
+        if len(to_sniff) > SNIFF_PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=SNIFF_WORKERS) as executor:
+                sniffed = dict(zip(to_sniff, executor.map(is_text_file, to_sniff)))
+        else:
+            sniffed = {path: is_text_file(path) for path in to_sniff}
+
+        for path, is_text in candidates:
+            if is_text or (is_text is None and sniffed[path]):
+                logger.debug(f"Adding file: {path}")
+                file_list.append(path)
 
     def update_exclusion_list(self, item, column):
         """Update the list of excluded files based on checkbox state"""
@@ -2740,45 +3381,38 @@ class CodeCombinerApp(QMainWindow):
 
         is_checked = item.checkState(0) == Qt.CheckState.Checked
 
-        # Get the full path of the item
-        path_parts = []
-        temp_item = item
-        while temp_item is not None:
-            path_parts.insert(0, temp_item.text(0))
-            temp_item = temp_item.parent()
+        # Get the full path of the item (stored on it when it was created)
+        full_path = self.file_tree_widget.get_item_path(item)
 
-        # Skip the root item name which is just the folder name
-        path_parts.pop(0)
-
-        # Get base directory (from the input field)
-        base_dir = self.input_folder_edit.text()
-
-        # Construct full path
-        full_path = os.path.join(base_dir, *path_parts)
-
-        # Handle directory checkboxes (apply to all children)
-        if item.text(1) == "folder":
-            self._update_children_check_state(item, is_checked)
-
-            # Update the exclusion list for this directory and all its contents
-            if is_checked:
-                # Remove this directory and all its contents from exclusion list
-                self.excluded_paths = {p for p in self.excluded_paths if not p.startswith(full_path)}
-            else:
-                # Add all text files in this directory to exclusion list
-                self._add_directory_to_exclusions(full_path)
-        else:
-            # Handle individual file checkboxes
-            if is_checked:
-                self.excluded_paths.discard(full_path)
+        # Descendant and ancestor checkboxes are updated under one signal block
+        tree = self.file_tree_widget
+        was_blocked = tree.blockSignals(True)
+        try:
+            # Handle directory checkboxes (apply to all children)
+            if item.text(1) == ITEM_TYPE_FOLDER:
+                self._update_children_check_state(item, is_checked)
+
+                # Update the exclusion list for this directory and all its contents
+                if is_checked:
+                    # Remove this directory and all its contents from exclusion list
+                    self.excluded_paths.discard_tree(full_path)
+                else:
+                    # Add all text files in this directory to exclusion list
+                    self._add_directory_to_exclusions(full_path)
             else:
-                self.excluded_paths.add(full_path)
+                # Handle individual file checkboxes
+                if is_checked:
+                    self.excluded_paths.discard(full_path)
+                else:
+                    self.excluded_paths.add(full_path)
 
-        # Update parent folder check state based on children
-        self._update_parent_check_state(item.parent())
+            # Update parent folder check state based on children
+            self._update_parent_check_state(item.parent())
+        finally:
+            tree.blockSignals(was_blocked)
 
-        # Update the output preview
-        self.update_output_preview()
+        # Update the output preview once the burst of changes settles
+        self._preview_timer.start()
 
     def update_output_preview(self):
         """Update the output preview tab with sample of how the output will look"""
@@ -2798,115 +3432,159 @@ class CodeCombinerApp(QMainWindow):
             self.output_preview_edit.setPlainText("All files are excluded. Select some files to include in the output.")
             return
 
-        # Generate preview based on selected separator style
+        # Generate preview based on selected separator style, picking its renderer once
         separator_style = self.separator_style_combo.currentText()
-        preview_text = f"# Combined Code Preview\n# Using {separator_style} style\n\n"
+        render_separator = {
+            "Simple": self._preview_simple,
+            "Detailed": self._preview_detailed,
+        }.get(separator_style, self._preview_markdown)
+        root_folder = self.input_folder_edit.text()
+        parts = [f"# Combined Code Preview\n# Using {separator_style} style\n\n"]
 
         for file_path in preview_files:
-            rel_path = os.path.relpath(file_path, self.input_folder_edit.text())
+            rel_path = os.path.relpath(file_path, root_folder)
+            separator, header, footer = render_separator(file_path, rel_path)
+            parts.append(separator)
+            parts.append(header)
 
-            if separator_style == "Simple":
-                separator = f"\n\n{'=' * 80}\n"
-                header = f"FILE: {rel_path}\n{'=' * 80}\n\n"
-                footer = ""
-            elif separator_style == "Detailed":
-                file_size = os.path.getsize(file_path)
-                file_time = os.path.getmtime(file_path)
-                timestamp = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M:%S')
-
-                separator = f"\n\n{'=' * 80}\n"
-                header = f"FILE: {rel_path}\n"
-                header += f"SIZE: {file_size} bytes\n"
-                header += f"MODIFIED: {timestamp}\n"
-                header += f"{'=' * 80}\n\n"
-                footer = ""
-            else:  # Markdown
-                separator = f"\n\n"
-                ext = os.path.splitext(file_path)[1][1:] or "text"
-                header = f"## {rel_path}\n\n```{ext}\n"
-                footer = "\n```\n"
-
-            preview_text += separator
-            preview_text += header
-
-            # Add a snippet of the file (first 20 lines)
+            # Add a snippet of the file (first 20 lines); only one more line is read
+            # to tell whether it continues
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    content = ''.join(lines[:min(20, len(lines))])
-                    if len(lines) > 20:
-                        content += "\n... (content truncated for preview) ...\n"
-                    preview_text += content
+                    parts.append(''.join(islice(f, 20)))
+                    if f.readline():
+                        parts.append("\n... (content truncated for preview) ...\n")
             except Exception as e:
-                preview_text += f"[Error reading file: {str(e)}]"
+                parts.append(f"[Error reading file: {str(e)}]")
 
-            preview_text += footer
+            parts.append(footer)
 
         # Add note about full content
         if len(self.file_list) - len(self.excluded_paths) > 3:
             remaining = len(self.file_list) - len(self.excluded_paths) - 3
-            preview_text += f"\n\n... Plus {remaining} more file(s) ...\n"
-
-        self.output_preview_edit.setPlainText(preview_text)
+            parts.append(f"\n\n... Plus {remaining} more file(s) ...\n")
+
+        self.output_preview_edit.setPlainText(''.join(parts))
+
+    def _preview_simple(self, file_path, rel_path):
+        """Return (separator, header, footer) text for the Simple style preview."""
+        return PREVIEW_SEPARATOR_LINE, f"FILE: {rel_path}\n{PREVIEW_HEADER_END}", ""
+
+    def _preview_detailed(self, file_path, rel_path):
+        """Return (separator, header, footer) text for the Detailed style preview."""
+        # One stat gives both the size and the modification time
+        stat_result = os.stat(file_path)
+        timestamp = datetime.fromtimestamp(stat_result.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        header = (f"FILE: {rel_path}\n"
+                  f"SIZE: {stat_result.st_size} bytes\n"
+                  f"MODIFIED: {timestamp}\n"
+                  f"{PREVIEW_HEADER_END}")
+        return PREVIEW_SEPARATOR_LINE, header, ""
+
+    def _preview_markdown(self, file_path, rel_path):
+        """Return (separator, header, footer) text for the Markdown style preview."""
+        ext = os.path.splitext(file_path)[1][1:] or "text"
+        return "\n\n", f"## {rel_path}\n\n```{ext}\n", "\n```\n"
 
     def _update_children_check_state(self, item, checked):
-        """Recursively update all children checkboxes"""
+        """Update the checkboxes of every loaded item under item"""
         check_state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        checkable = Qt.ItemFlag.ItemIsUserCheckable
 
-        # Block signals to prevent cascade
+        # Block signals to prevent cascade; the previous state is restored afterwards,
+        # so the whole subtree is updated without emitting itemChanged
         tree = item.treeWidget()
         if tree:
-            tree.blockSignals(True)
+            was_blocked = tree.blockSignals(True)
+
+        # Only loaded items exist; folders loaded later start from the mode's default state
+        stack = [item]
+        while stack:
+            parent = stack.pop()
+            for i in range(parent.childCount()):
+                child = parent.child(i)
+                if child.flags() & checkable:
+                    child.setCheckState(0, check_state)
+                if child.childCount():
+                    stack.append(child)
+
+        # Restore signals
+        if tree:
+            tree.blockSignals(was_blocked)
 
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if child.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-                child.setCheckState(0, check_state)
+    def _set_all_check_states(self, should_check):
+        """Set every loaded item's checkbox, repainting the tree once at the end"""
+        root_item = self.file_tree_widget.topLevelItem(0)
+        tree = self.file_tree_widget
+        tree.setUpdatesEnabled(False)
+        was_blocked = tree.blockSignals(True)
+        try:
+            root_item.setCheckState(0, Qt.CheckState.Checked if should_check else Qt.CheckState.Unchecked)
+            self._update_children_check_state(root_item, should_check)
+        finally:
+            tree.blockSignals(was_blocked)
+            tree.setUpdatesEnabled(True)
 
-            # Recursively update children of this child if it's a folder
-            if child.text(1) == "folder":
-                self._update_children_check_state(child, checked)
+    def _update_parent_check_state(self, parent_item):
+        """Update ancestor checkboxes based on their children's state"""
+        checkable = Qt.ItemFlag.ItemIsUserCheckable
+        checked = Qt.CheckState.Checked
 
-        # Unblock signals
+        # Block signals to prevent cascade when updating ancestor states
+        tree = parent_item.treeWidget() if parent_item is not None else None
         if tree:
-            tree.blockSignals(False)
+            was_blocked = tree.blockSignals(True)
 
-    def _update_parent_check_state(self, parent_item):
-        """Update parent checkbox based on children state"""
-        if parent_item is None:
-            return
+        while parent_item is not None:
+            all_checked = True
+            all_unchecked = True
 
-        all_checked = True
-        all_unchecked = True
+            for i in range(parent_item.childCount()):
+                child = parent_item.child(i)
+                if child.flags() & checkable:
+                    if child.checkState(0) == checked:
+                        all_unchecked = False
+                    else:
+                        all_checked = False
 
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            if child.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-                if child.checkState(0) == Qt.CheckState.Checked:
-                    all_unchecked = False
-                else:
-                    all_checked = False
-
-        # Block signals to prevent cascade when updating parent state
-        parent_item.treeWidget().blockSignals(True)
-        if all_checked:
-            parent_item.setCheckState(0, Qt.CheckState.Checked)
-        elif all_unchecked:
-            parent_item.setCheckState(0, Qt.CheckState.Unchecked)
-        else:
-            parent_item.setCheckState(0, Qt.CheckState.PartiallyChecked)
-        parent_item.treeWidget().blockSignals(False)
+            if all_checked:
+                new_state = checked
+            elif all_unchecked:
+                new_state = Qt.CheckState.Unchecked
+            else:
+                new_state = Qt.CheckState.PartiallyChecked
 
-        # Recursively update parent's parent
-        self._update_parent_check_state(parent_item.parent())
+            # An unchanged folder leaves everything above it unchanged too
+            if parent_item.checkState(0) == new_state:
+                break
+            parent_item.setCheckState(0, new_state)
+            parent_item = parent_item.parent()
+
+        if tree:
+            tree.blockSignals(was_blocked)
 
     def _add_directory_to_exclusions(self, directory):
         """Add all text files from a directory to exclusions list"""
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if is_text_file(file_path):
-                    self.excluded_paths.add(file_path)
+        # scandir entries know their type from the listing, so only files are stat'ed
+        add_excluded = self.excluded_paths.add
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk, list symlinked folders but don't descend into them
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif is_text_file(entry.path):
+                    add_excluded(entry.path)
 
     def _preview_file(self, file_path):
         """Show file contents in preview tab"""
@@ -2914,60 +3592,111 @@ class CodeCombinerApp(QMainWindow):
             # Update file label
             rel_path = os.path.relpath(file_path, self.input_folder_edit.text())
             self.preview_file_label.setText(f"File: {rel_path}")
+        except Exception as e:
+            self.preview_edit.setPlainText(f"Error loading file: {str(e)}")
+            return
 
-            # Read file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Read the file on the thread pool; only the most recent click is shown
+        self._preview_read_id += 1
+        task = PreviewReadTask(self._preview_read_id, file_path)
+        task.signals.preview_read.connect(self._on_preview_read)
+        self._preview_read_task = task
+        QThreadPool.globalInstance().start(task)
 
-            # Set preview content
-            self.preview_edit.setPlainText(content)
+    def _on_preview_read(self, request_id, file_path, content, more, error):
+        """Show a file read by PreviewReadTask in the preview tab."""
+        if request_id != self._preview_read_id:
+            return
+        self._preview_read_task = None
 
-            # Switch to preview tab
-            self.central_widget.findChild(QTabWidget).setCurrentIndex(1)
+        if content is None:
+            self.preview_edit.setPlainText(f"Error loading file: {error}")
+            return
 
-        except Exception as e:
-            self.preview_edit.setPlainText(f"Error loading file: {str(e)}")
+        # Set preview content
+        self._set_preview_text(content, more)
+
+        # Switch to preview tab
+        self.right_panel.setCurrentIndex(1)
+
+    def _set_preview_text(self, content, more=False):
+        """Show content in the preview, skipping highlighting for large texts.
+
+        more is True when content is only the head of a longer file.
+        """
+        # QSyntaxHighlighter slows sharply on large documents, so detach it above the limit
+        highlight_limit = self.settings.value("highlight_limit_kb", DEFAULT_HIGHLIGHT_LIMIT_KB, type=int) * 1024
+        if len(content) > highlight_limit:
+            self.syntax_highlighter.setDocument(None)
+        elif self.syntax_highlighter.document() is None:
+            self.syntax_highlighter.setDocument(self.preview_edit.document())
+
+        # Only the first PREVIEW_MAX_LINES lines are shown
+        end = -1
+        for _ in range(PREVIEW_MAX_LINES):
+            end = content.find('\n', end + 1)
+            if end < 0:
+                break
+        if end >= 0 and end < len(content) - 1:
+            total_lines = content.count('\n') + (not content.endswith('\n'))
+            content = (f"{content[:end + 1]}\n"
+                       f"[truncated: showing the first {PREVIEW_MAX_LINES} of "
+                       f"{total_lines}{'+' if more else ''} lines]")
+        elif more:
+            content += f"\n[truncated: showing the first {PREVIEW_MAX_BYTES // 1024} KB]"
+
+        self.preview_edit.setPlainText(content)
+
+    def _apply_filter(self):
+        """Filter the tree with the filter box's current text."""
+        self.filter_files(self.filter_edit.text())
 
     def filter_files(self, filter_text):
         """Filter files in the tree view"""
         if not filter_text:
-            # Show all items
-            for i in range(self.file_tree_widget.topLevelItemCount()):
-                self._show_all_items(self.file_tree_widget.topLevelItem(i))
+            # Show all items, repainting once at the end
+            tree = self.file_tree_widget
+            tree.setUpdatesEnabled(False)
+            try:
+                for i in range(tree.topLevelItemCount()):
+                    self._show_all_items(tree.topLevelItem(i))
+            finally:
+                tree.setUpdatesEnabled(True)
             return
 
-        filter_text = filter_text.lower()
-
-        # First pass - hide all items
-        for i in range(self.file_tree_widget.topLevelItemCount()):
-            self._hide_all_items(self.file_tree_widget.topLevelItem(i))
-
-        # Second pass - show matching items and their parents
-        for i in range(self.file_tree_widget.topLevelItemCount()):
-            self._show_matching_items(self.file_tree_widget.topLevelItem(i), filter_text)
+        # Compile the filter once per keystroke; '*' and '?' act as glob wildcards
+        if '*' in filter_text or '?' in filter_text:
+            matcher = re.compile(fnmatch.translate(filter_text), re.IGNORECASE).match
+        else:
+            matcher = re.compile(re.escape(filter_text), re.IGNORECASE).search
 
-    def _hide_all_items(self, item):
-        """Recursively hide all items in the tree"""
-        item.setHidden(True)
-        for i in range(item.childCount()):
-            self._hide_all_items(item.child(i))
+        # Single pass - every item's visibility is set by the match walk. Matching folders
+        # are expanded one by one, so painting is suspended until the walk is done
+        tree = self.file_tree_widget
+        tree.setUpdatesEnabled(False)
+        try:
+            for i in range(tree.topLevelItemCount()):
+                self._show_matching_items(tree.topLevelItem(i), matcher)
+        finally:
+            tree.setUpdatesEnabled(True)
 
     def _show_all_items(self, item):
-        """Recursively show all items in the tree"""
-        item.setHidden(False)
+        """Recursively show all items in the tree except files of ignored extensions"""
+        item.setHidden(self.file_tree_widget.is_extension_ignored(item))
         for i in range(item.childCount()):
             self._show_all_items(item.child(i))
 
-    def _show_matching_items(self, item, filter_text):
-        """Recursively show items that match the filter text"""
-        # Check if this item matches
-        item_matches = filter_text in item.text(0).lower()
+    def _show_matching_items(self, item, matcher):
+        """Recursively show items whose name matches the compiled filter"""
+        # Check if this item matches (files of ignored extensions never do)
+        item_matches = (matcher(item.text(0)) is not None
+                        and not self.file_tree_widget.is_extension_ignored(item))
 
         # Check children
         has_matching_child = False
         for i in range(item.childCount()):
-            child_matches = self._show_matching_items(item.child(i), filter_text)
-            has_matching_child = has_matching_child or child_matches
+            if self._show_matching_items(item.child(i), matcher):
+                has_matching_child = True
 
         # Show this item if it matches or has a matching child
         show_item = item_matches or has_matching_child
@@ -2979,17 +3708,6 @@ class CodeCombinerApp(QMainWindow):
 
         return show_item
 
-    def format_size(self, size_bytes):
-        """Format file size in human-readable format"""
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-
     @log_performance
     def start_processing(self, checked=False):
         """Start processing files. The checked parameter is from the button signal and is ignored."""
@@ -3105,13 +3823,13 @@ class CodeCombinerApp(QMainWindow):
 
             if reply == QMessageBox.StandardButton.Yes:
                 try:
-                    with open(self.output_file_edit.text(), 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    # The combined file can be very large, so only its head is read
+                    content, more = read_preview_text(self.output_file_edit.text())
 
                     # Update the preview tab with content
                     self.preview_file_label.setText(f"Output File: {os.path.basename(self.output_file_edit.text())}")
-                    self.preview_edit.setPlainText(content)
-                    self.central_widget.findChild(QTabWidget).setCurrentIndex(1)
+                    self._set_preview_text(content, more)
+                    self.right_panel.setCurrentIndex(1)
 
                 except Exception as e:
                     QMessageBox.warning(self, "Preview Error", f"Could not load file preview: {str(e)}")
@@ -3128,16 +3846,13 @@ class CodeCombinerApp(QMainWindow):
             reverse_mode = self.file_tree_widget.reverse_ignore_mode
             should_check = reverse_mode  # Reverse mode: check, Normal mode: uncheck
 
-            # Block signals during bulk operation
-            self.file_tree_widget.blockSignals(True)
-            root_item.setCheckState(0, Qt.CheckState.Checked if should_check else Qt.CheckState.Unchecked)
-            self._update_children_check_state(root_item, should_check)
-            self.file_tree_widget.blockSignals(False)
+            # Bulk update with signals and painting suspended
+            self._set_all_check_states(should_check)
 
             self.excluded_paths.clear()
 
-            # Update the output preview
-            self.update_output_preview()
+            # Update the output preview; repeated clicks coalesce into one rebuild
+            self._preview_timer.start()
 
             # Show confirmation message
             mode_msg = "checked" if should_check else "unchecked"
@@ -3152,19 +3867,16 @@ class CodeCombinerApp(QMainWindow):
             reverse_mode = self.file_tree_widget.reverse_ignore_mode
             should_check = not reverse_mode  # Normal mode: check, Reverse mode: uncheck
 
-            # Block signals during bulk operation
-            self.file_tree_widget.blockSignals(True)
-            root_item.setCheckState(0, Qt.CheckState.Checked if should_check else Qt.CheckState.Unchecked)
-            self._update_children_check_state(root_item, should_check)
-            self.file_tree_widget.blockSignals(False)
+            # Bulk update with signals and painting suspended
+            self._set_all_check_states(should_check)
 
             # Add all files to excluded paths
             input_folder = self.input_folder_edit.text()
             if os.path.isdir(input_folder):
                 self._add_directory_to_exclusions(input_folder)
 
-            # Update the output preview
-            self.update_output_preview()
+            # Update the output preview; repeated clicks coalesce into one rebuild
+            self._preview_timer.start()
 
             # Show confirmation message
             mode_msg = "checked" if should_check else "unchecked"